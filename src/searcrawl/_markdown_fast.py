@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Markdown Fast Module - Plain text conversion helpers for crawled content
+
+This module holds the CPU-bound Markdown/HTML to plain text conversions used
+by WebCrawler, together with the precompiled patterns and the shared mistune
+renderer they rely on.
+"""
+
+import re
+from typing import Callable, Pattern
+
+import mistune
+from selectolax.parser import HTMLParser
+
+# Precompiled patterns used by markdown_to_text_regex
+_RE_HEADING: Pattern[str] = re.compile(r'#+\s*')
+_RE_LINK: Pattern[str] = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+_RE_BOLD: Pattern[str] = re.compile(r'(\*\*|__)(.*?)\1')
+_RE_ITALIC: Pattern[str] = re.compile(r'(\*|_)(.*?)\1')
+_RE_LIST_MARKER: Pattern[str] = re.compile(r'^[\*\-\+]\s*', re.MULTILINE)
+_RE_CODE_BLOCK: Pattern[str] = re.compile(r'`{3}.*?`{3}', re.DOTALL)
+_RE_INLINE_CODE: Pattern[str] = re.compile(r'`(.*?)`')
+_RE_QUOTE: Pattern[str] = re.compile(r'^>\s*', re.MULTILINE)
+
+# Markdown renderer shared by all conversions; raw HTML in Reader output is kept as-is
+_MARKDOWN: Callable[[str], str] = mistune.create_markdown(escape=False)  # type: ignore[assignment]
+
+
+def markdown_to_text_regex(markdown_str: str) -> str:
+    """Convert Markdown text to plain text using regular expressions
+
+    Args:
+        markdown_str: Markdown formatted text
+
+    Returns:
+        str: Converted plain text
+    """
+    # Each pass is skipped when its marker character is absent, which a
+    # C-level substring check decides far faster than a regex scan
+    text = markdown_str
+
+    # Remove heading symbols
+    if '#' in text:
+        text = _RE_HEADING.sub('', text)
+
+    # Remove links and images
+    if '[' in text:
+        text = _RE_LINK.sub(r'\1', text)
+
+    # Remove bold, italic, and other emphasis markers
+    if '*' in text or '_' in text:
+        text = _RE_BOLD.sub(r'\2', text)
+        text = _RE_ITALIC.sub(r'\2', text)
+
+    # Remove list markers
+    text = _RE_LIST_MARKER.sub('', text)
+
+    # Remove code blocks
+    if '`' in text:
+        text = _RE_CODE_BLOCK.sub('', text)
+        text = _RE_INLINE_CODE.sub(r'\1', text)
+
+    # Remove quote blocks
+    if '>' in text:
+        text = _RE_QUOTE.sub('', text)
+
+    return text.strip()
+
+
+def html_to_text(html: str) -> str:
+    """Convert HTML to plain text using the selectolax library
+
+    Args:
+        html: HTML formatted text
+
+    Returns:
+        str: Converted plain text
+    """
+    # Extract plain text using selectolax's C-based HTML parser
+    text: str = HTMLParser(html).text(separator="\n")  # Preserve paragraph line breaks
+
+    # Clean up extra blank lines, stripping each line only once and
+    # joining lazily without an intermediate list
+    return "\n".join(filter(None, map(str.strip, text.split("\n"))))
+
+
+def markdown_to_text(markdown_str: str) -> str:
+    """Convert Markdown text to plain text using mistune and selectolax libraries
+
+    Args:
+        markdown_str: Markdown formatted text
+
+    Returns:
+        str: Converted plain text
+    """
+    return html_to_text(_MARKDOWN(markdown_str))
@@ -7,38 +7,207 @@ allowing multiple instances to share cached crawl results and reduce redundant
 crawling operations.
 """
 
-import json
-import hashlib
-from typing import Optional, Dict, Any
-from redis import Redis
+import asyncio
+import orjson
+import xxhash
+from functools import lru_cache
+from typing import Optional, Dict, Any, Set, List, Callable, Awaitable
+from redis.asyncio import ConnectionPool, Redis
 from datetime import datetime, timedelta
-import redis
 from loguru import logger
 
+# Keys requested per SCAN call and keys removed per UNLINK call
+SCAN_COUNT = 1000
+UNLINK_BATCH_SIZE = 500
+
+# Time-to-live for cached search results in seconds
+SEARCH_CACHE_TTL_SECONDS = 300
+
+# Seconds concurrent single-query search cache calls are collected into one batch
+SEARCH_BATCH_WINDOW_SECONDS = 0.002
+
+# Maximum connections held by each shared Redis connection pool
+MAX_CONNECTIONS = 32
+
+# Connection pools shared by every CacheManager pointing at the same Redis URL
+_connection_pools: Dict[str, ConnectionPool] = {}
+
+
+@lru_cache(maxsize=8192)
+def _hash_key(url: str, instruction: str, prefix: str) -> str:
+    """Hash a URL/instruction pair into a namespaced cache key
+
+    Memoized because the same pairs are hashed repeatedly: on lookup, on
+    write-back after a crawl, and again when URLs recur in later batches.
+
+    Args:
+        url: The URL (or other primary value) to hash
+        instruction: Instruction/query string paired with the value
+        prefix: Key namespace, e.g. 'crawl_cache'
+
+    Returns:
+        str: Generated cache key
+    """
+    # Create a non-cryptographic hash of the value and instruction; prefixing
+    # the value's length fixes where it ends whatever either part contains,
+    # so ('a:b', 'c') and ('a', 'b:c') differ
+    cache_hash = xxhash.xxh3_128_hexdigest(f"{len(url)}:{url}{instruction}".encode('utf-8'))
+    return f"{prefix}:{cache_hash}"
+
+
+def search_cache_signature(
+    query: str,
+    limit: Optional[int] = None,
+    disabled_engines: str = "",
+    enabled_engines: str = ""
+) -> str:
+    """Build the string identifying a search for caching purposes
+
+    Searches for the same query with a different limit or engine selection
+    return different results, so every parameter is part of the signature.
+    The parameters are encoded as a JSON array, so no choice of field values
+    can make two different searches share a signature.
+
+    Args:
+        query: The search query string
+        limit: Limit on number of results, None if not part of the search
+        disabled_engines: Comma-separated list of disabled engines
+        enabled_engines: Comma-separated list of enabled engines
+
+    Returns:
+        str: Signature usable with the search cache batch methods
+    """
+    return orjson.dumps([query, limit, disabled_engines, enabled_engines]).decode()
+
+
+def _get_connection_pool(redis_url: str) -> ConnectionPool:
+    """Get or lazily create the shared connection pool for a Redis URL
+
+    Args:
+        redis_url: Redis connection URL
+
+    Returns:
+        ConnectionPool: Connection pool shared across cache managers
+    """
+    pool = _connection_pools.get(redis_url)
+    if pool is None:
+        pool = ConnectionPool.from_url(
+            redis_url,
+            max_connections=MAX_CONNECTIONS,
+            decode_responses=False
+        )
+        _connection_pools[redis_url] = pool
+    return pool
+
+
+class _Coalescer:
+    """Merge concurrent single-key calls into one batch call per time window
+
+    The first submit() in a window schedules a flush; every key submitted
+    before the flush runs is handed to the batch function together, and each
+    caller receives the value the batch returned for its key.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+        window: float
+    ):
+        """Initialize the coalescer
+
+        Args:
+            flush: Batch function mapping {key: value} to {key: result}
+            window: Seconds to wait for more keys before flushing
+        """
+        self._flush = flush
+        self._window = window
+        self._items: Dict[str, Any] = {}
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def submit(self, key: str, value: Any = None) -> Any:
+        """Queue a key for the next batch and wait for its result
+
+        Args:
+            key: Key to look up or store
+            value: Value passed to the batch function for this key
+
+        Returns:
+            Any: Result the batch function returned for the key, None if missing
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._items[key] = value
+        self._waiters.setdefault(key, []).append(future)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            self._task.add_done_callback(self._release_unflushed)
+        return await future
+
+    def _release_unflushed(self, task: asyncio.Task) -> None:
+        """Answer queued callers of a flush task cancelled before it started
+
+        Args:
+            task: The finished flush task
+        """
+        # _run() clears _task as soon as it takes the queued keys, so it is
+        # only still set if the task was cancelled before its body ever ran
+        if self._task is not task:
+            return
+        waiters = self._waiters
+        self._items, self._waiters, self._task = {}, {}, None
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _run(self) -> None:
+        """Wait out the window, then flush every queued key in one batch"""
+        results: Dict[str, Any] = {}
+        waiters: Optional[Dict[str, List[asyncio.Future]]] = None
+        try:
+            await asyncio.sleep(self._window)
+            items, waiters = self._items, self._waiters
+            self._items, self._waiters, self._task = {}, {}, None
+            results = await self._flush(items)
+        finally:
+            if waiters is None:
+                # Cancelled during the window: answer the queued callers and
+                # let the next submit() schedule a fresh flush
+                waiters = self._waiters
+                self._items, self._waiters, self._task = {}, {}, None
+            # Release every waiter, even when the flush was cancelled or failed
+            for key, futures in waiters.items():
+                for future in futures:
+                    if not future.done():
+                        future.set_result(results.get(key))
+
 
 class CacheManager:
-    """Distributed cache manager using Redis backend"""
+    """Distributed cache manager using an asyncio Redis backend"""
 
     def __init__(self, redis_url: str, ttl_hours: int = 24):
         """Initialize cache manager with Redis connection
 
+        Connections are opened lazily from a shared pool; use is_available()
+        to verify that Redis is reachable.
+
         Args:
             redis_url: Redis connection URL (e.g., 'redis://localhost:6379/0')
             ttl_hours: Time-to-live for cached items in hours, default is 24
         """
-        # initialize attribute for type checkers
-        self.redis_client: Optional[Redis] = None
+        self.ttl_seconds = ttl_hours * 3600
+        # Strong references to in-flight background writes so they are not GC'd
+        self._pending_writes: Set[asyncio.Task] = set()
+        # Concurrent search cache lookups and writes share MGET/pipeline round-trips
+        self._search_gets = _Coalescer(self._flush_search_gets, SEARCH_BATCH_WINDOW_SECONDS)
+        self._search_sets = _Coalescer(self._flush_search_sets, SEARCH_BATCH_WINDOW_SECONDS)
+        self.redis_client: Optional[Redis]
         try:
-            self.redis_client = redis.from_url(redis_url, decode_responses=True)
-            # Test connection
-            assert self.redis_client is not None
-            self.redis_client.ping()
-            self.ttl_seconds = ttl_hours * 3600
+            self.redis_client = Redis(connection_pool=_get_connection_pool(redis_url))
             logger.info(f"Cache manager initialized with Redis: {redis_url}, TTL: {ttl_hours} hours")
         except Exception as e:
             logger.error(f"Failed to initialize cache manager: {str(e)}")
             self.redis_client = None
-            self.ttl_seconds = ttl_hours * 3600
 
     def _generate_cache_key(self, url: str, instruction: str = "") -> str:
         """Generate a cache key from URL and instruction
@@ -50,10 +219,7 @@ class CacheManager:
         Returns:
             str: Generated cache key
         """
-        # Create a hash of URL and instruction to generate cache key
-        cache_input = f"{url}:{instruction}".encode('utf-8')
-        cache_hash = hashlib.md5(cache_input).hexdigest()
-        return f"crawl_cache:{cache_hash}"
+        return _hash_key(url, instruction, "crawl_cache")
 
     def _generate_search_cache_key(self, query: str) -> str:
         """Generate a cache key from a search query
@@ -64,73 +230,147 @@ class CacheManager:
         Returns:
             str: Generated cache key
         """
-        cache_input = f"search:{query}".encode('utf-8')
-        cache_hash = hashlib.md5(cache_input).hexdigest()
-        return f"search_cache:{cache_hash}"
-
-    def get_search_cache(self, query: str) -> Optional[Dict[str, Any]]:
+        return _hash_key("search", query, "search_cache")
+
+    async def get_search_cache(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        disabled_engines: str = "",
+        enabled_engines: str = ""
+    ) -> Optional[Dict[str, Any]]:
         """Get cached search result for a query
         
         Args:
             query: The search query to retrieve from cache
+            limit: Limit on number of results the search was made with
+            disabled_engines: Comma-separated list of disabled engines
+            enabled_engines: Comma-separated list of enabled engines
             
         Returns:
             Dict or None: Cached result if found, None otherwise
         """
+        signature = search_cache_signature(query, limit, disabled_engines, enabled_engines)
+        return await self._search_gets.submit(signature)
+
+    async def set_search_cache(
+        self,
+        query: str,
+        result: Dict[str, Any],
+        limit: Optional[int] = None,
+        disabled_engines: str = "",
+        enabled_engines: str = ""
+    ) -> bool:
+        """Cache a search result for a query with a 5-minute TTL
+        
+        Args:
+            query: The search query being cached
+            result: The search result to cache
+            limit: Limit on number of results the search was made with
+            disabled_engines: Comma-separated list of disabled engines
+            enabled_engines: Comma-separated list of enabled engines
+            
+        Returns:
+            bool: True if caching succeeded, False otherwise
+        """
+        signature = search_cache_signature(query, limit, disabled_engines, enabled_engines)
+        return bool(await self._search_sets.submit(signature, result))
+
+    async def _flush_search_gets(self, items: Dict[str, Any]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Resolve a coalesced batch of search cache lookups with one MGET
+
+        Args:
+            items: Mapping whose keys are the search signatures to look up
+
+        Returns:
+            Dict: Mapping of signatures to cached results (None if not found)
+        """
+        return await self.get_search_cache_batch(list(items))
+
+    async def _flush_search_sets(self, items: Dict[str, Dict[str, Any]]) -> Dict[str, bool]:
+        """Store a coalesced batch of search results with one pipeline
+
+        Args:
+            items: Mapping of search signatures to the results to cache
+
+        Returns:
+            Dict: Mapping of signatures to whether the whole batch was stored
+        """
+        stored = await self.set_search_cache_batch(items) == len(items)
+        return {signature: stored for signature in items}
+
+    async def get_search_cache_batch(self, queries: list) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get cached search results for multiple queries
+
+        Args:
+            queries: List of search_cache_signature() values
+
+        Returns:
+            Dict: Mapping of queries to cached results (None if not found)
+        """
         if not self.redis_client:
             logger.debug("Redis client not available, skipping cache retrieval")
-            return None
-            
+            return {query: None for query in queries}
+
+        if not queries:
+            return {}
+
         try:
-            cache_key = self._generate_search_cache_key(query)
-            cached_data = self.redis_client.get(cache_key)
-            
-            if cached_data:
-                result = json.loads(str(cached_data))
-                logger.debug(f"Search cache hit for query: {query}")
+            # Fetch all keys in a single MGET round-trip
+            keys = [self._generate_search_cache_key(query) for query in queries]
+            cached_values = await self.redis_client.mget(keys)
+
+            results = {}
+            for query, cached_data in zip(queries, cached_values):
                 # The actual result is nested inside the 'result' key
-                return result.get("result")
-            else:
-                logger.debug(f"Search cache miss for query: {query}")
-                return None
+                results[query] = orjson.loads(cached_data).get("result") if cached_data else None
+            logger.debug(f"Search cache lookup: {sum(1 for r in results.values() if r)}/{len(queries)} hits")
+            return results
         except Exception as e:
             logger.warning(f"Error retrieving from search cache: {str(e)}")
-            return None
+            return {query: None for query in queries}
+
+    async def set_search_cache_batch(self, results: Dict[str, Dict[str, Any]]) -> int:
+        """Cache search results for multiple queries with a 5-minute TTL
 
-    def set_search_cache(self, query: str, result: Dict[str, Any]) -> bool:
-        """Cache a search result for a query with a 1-minute TTL
-        
         Args:
-            query: The search query being cached
-            result: The search result to cache
-            
+            results: Mapping of search_cache_signature() values to the
+                results to cache
+
         Returns:
-            bool: True if caching succeeded, False otherwise
+            int: Number of results successfully cached
         """
         if not self.redis_client:
             logger.debug("Redis client not available, skipping cache storage")
-            return False
-            
+            return 0
+
+        if not results:
+            return 0
+
         try:
-            cache_key = self._generate_search_cache_key(query)
-            cache_data = {
-                "result": result,
-                "cached_at": datetime.now().isoformat(),
-                "query": query
-            }
-            
-            self.redis_client.setex(
-                cache_key,
-                300, # 1 minute TTL
-                json.dumps(cache_data, ensure_ascii=False)
-            )
-            logger.debug(f"Cached search result for query: {query}")
-            return True
+            # Queue all writes and flush them in a single round-trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            cached_at = datetime.now().isoformat()
+            for query, result in results.items():
+                cache_data = {
+                    "result": result,
+                    "cached_at": cached_at,
+                    "query": query
+                }
+                pipe.setex(
+                    self._generate_search_cache_key(query),
+                    SEARCH_CACHE_TTL_SECONDS,
+                    orjson.dumps(cache_data)
+                )
+            replies = await pipe.execute()
+            success_count = sum(1 for r in replies if r)
+            logger.debug(f"Cached {success_count}/{len(results)} search results")
+            return success_count
         except Exception as e:
             logger.warning(f"Error storing in search cache: {str(e)}")
-            return False
+            return 0
 
-    def get(self, url: str, instruction: str = "") -> Optional[Dict[str, Any]]:
+    async def get(self, url: str, instruction: str = "") -> Optional[Dict[str, Any]]:
         """Get cached crawl result for a URL
 
         Args:
@@ -140,26 +380,9 @@ class CacheManager:
         Returns:
             Dict or None: Cached result if found, None otherwise
         """
-        if not self.redis_client:
-            logger.debug("Redis client not available, skipping cache retrieval")
-            return None
+        return (await self.get_batch([url], instruction)).get(url)
 
-        try:
-            cache_key = self._generate_cache_key(url, instruction)
-            cached_data = self.redis_client.get(cache_key)
-
-            if cached_data:
-                result = json.loads(cached_data)
-                logger.debug(f"Cache hit for URL: {url}")
-                return result
-            else:
-                logger.debug(f"Cache miss for URL: {url}")
-                return None
-        except Exception as e:
-            logger.warning(f"Error retrieving from cache: {str(e)}")
-            return None
-
-    def set(self, url: str, content: str, reference: str, instruction: str = "") -> bool:
+    async def set(self, url: str, content: str, reference: str, instruction: str = "") -> bool:
         """Cache a crawl result for a URL
 
         Args:
@@ -184,10 +407,10 @@ class CacheManager:
                 "url": url
             }
 
-            self.redis_client.setex(
+            await self.redis_client.setex(
                 cache_key,
                 self.ttl_seconds,
-                json.dumps(cache_data, ensure_ascii=False)
+                orjson.dumps(cache_data)
             )
             logger.debug(f"Cached result for URL: {url}")
             return True
@@ -195,7 +418,7 @@ class CacheManager:
             logger.warning(f"Error storing in cache: {str(e)}")
             return False
 
-    def get_batch(self, urls: list, instruction: str = "") -> Dict[str, Optional[Dict[str, Any]]]:
+    async def get_batch(self, urls: list, instruction: str = "") -> Dict[str, Optional[Dict[str, Any]]]:
         """Get cached results for multiple URLs
 
         Args:
@@ -209,16 +432,24 @@ class CacheManager:
             logger.debug("Redis client not available, skipping batch cache retrieval")
             return {url: None for url in urls}
 
+        if not urls:
+            return {}
+
         try:
+            # Fetch all keys in a single MGET round-trip
+            keys = [self._generate_cache_key(url, instruction) for url in urls]
+            cached_values = await self.redis_client.mget(keys)
+
             results = {}
-            for url in urls:
-                results[url] = self.get(url, instruction)
+            for url, cached_data in zip(urls, cached_values):
+                results[url] = orjson.loads(cached_data) if cached_data else None
+            logger.debug(f"Batch cache lookup: {sum(1 for r in results.values() if r)}/{len(urls)} hits")
             return results
         except Exception as e:
             logger.warning(f"Error retrieving batch from cache: {str(e)}")
             return {url: None for url in urls}
 
-    def set_batch(self, items: list, instruction: str = "") -> int:
+    async def set_batch(self, items: list, instruction: str = "") -> int:
         """Cache multiple crawl results
 
         Args:
@@ -232,17 +463,70 @@ class CacheManager:
             logger.debug("Redis client not available, skipping batch cache storage")
             return 0
 
+        if not items:
+            return 0
+
         try:
-            success_count = 0
+            # Queue all writes and flush them in a single round-trip
+            pipe = self.redis_client.pipeline(transaction=False)
+            cached_at = datetime.now().isoformat()
             for item in items:
-                if self.set(item.get("url"), item.get("content"), item.get("reference"), instruction):
-                    success_count += 1
+                url = item.get("url")
+                cache_data = {
+                    "content": item.get("content"),
+                    "reference": item.get("reference"),
+                    "cached_at": cached_at,
+                    "url": url
+                }
+                pipe.setex(
+                    self._generate_cache_key(url, instruction),
+                    self.ttl_seconds,
+                    orjson.dumps(cache_data)
+                )
+            results = await pipe.execute()
+            success_count = sum(1 for r in results if r)
+            logger.debug(f"Cached {success_count}/{len(items)} results in batch")
             return success_count
         except Exception as e:
             logger.warning(f"Error storing batch in cache: {str(e)}")
             return 0
 
-    def clear_url(self, url: str, instruction: str = "") -> bool:
+    def set_batch_nowait(self, items: list, instruction: str = "") -> Optional[asyncio.Task]:
+        """Schedule caching of multiple crawl results without waiting for Redis
+
+        Cache writes do not need to complete before a response is returned, so
+        the pipeline is executed in a background task.
+
+        Args:
+            items: List of dicts with 'url', 'content', and 'reference' keys
+            instruction: Optional instruction/query string
+
+        Returns:
+            asyncio.Task or None: The scheduled write task, None if nothing was scheduled
+        """
+        if not self.redis_client or not items:
+            return None
+
+        task = asyncio.create_task(self.set_batch(items, instruction))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
+        return task
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        """Release a finished background write and log its outcome
+
+        Args:
+            task: The completed write task
+        """
+        self._pending_writes.discard(task)
+        if task.cancelled():
+            logger.warning("Background cache write cancelled")
+        elif task.exception():
+            logger.warning(f"Background cache write failed: {str(task.exception())}")
+        else:
+            logger.debug(f"Background cache write stored {task.result()} results")
+
+    async def clear_url(self, url: str, instruction: str = "") -> bool:
         """Clear cache for a specific URL
 
         Args:
@@ -257,14 +541,14 @@ class CacheManager:
 
         try:
             cache_key = self._generate_cache_key(url, instruction)
-            self.redis_client.delete(cache_key)
+            await self.redis_client.delete(cache_key)
             logger.debug(f"Cleared cache for URL: {url}")
             return True
         except Exception as e:
             logger.warning(f"Error clearing cache: {str(e)}")
             return False
 
-    def clear_all(self) -> bool:
+    async def clear_all(self) -> bool:
         """Clear all crawl cache entries
 
         Returns:
@@ -274,22 +558,24 @@ class CacheManager:
             return False
 
         try:
-            # Use pattern matching to delete all crawl_cache keys
-            cursor = 0
+            # Use pattern matching to unlink all crawl_cache keys in batches;
+            # UNLINK reclaims memory in the background instead of blocking Redis
             deleted_count = 0
-            while True:
-                cursor, keys = self.redis_client.scan(cursor, match="crawl_cache:*", count=100)
-                if keys:
-                    deleted_count += self.redis_client.delete(*keys)
-                if cursor == 0:
-                    break
+            batch = []
+            async for key in self.redis_client.scan_iter(match="crawl_cache:*", count=SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= UNLINK_BATCH_SIZE:
+                    deleted_count += await self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted_count += await self.redis_client.unlink(*batch)
             logger.info(f"Cleared {deleted_count} cache entries")
             return True
         except Exception as e:
             logger.warning(f"Error clearing all cache: {str(e)}")
             return False
 
-    def get_cache_stats(self) -> Dict[str, Any]:
+    async def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics
 
         Returns:
@@ -299,15 +585,11 @@ class CacheManager:
             return {"status": "unavailable"}
 
         try:
-            cursor = 0
             total_entries = 0
-            while True:
-                cursor, keys = self.redis_client.scan(cursor, match="crawl_cache:*", count=100)
-                total_entries += len(keys)
-                if cursor == 0:
-                    break
+            async for _ in self.redis_client.scan_iter(match="crawl_cache:*", count=SCAN_COUNT):
+                total_entries += 1
 
-            info = self.redis_client.info()
+            info = await self.redis_client.info()
             return {
                 "status": "available",
                 "total_entries": total_entries,
@@ -318,7 +600,7 @@ class CacheManager:
             logger.warning(f"Error getting cache stats: {str(e)}")
             return {"status": "error", "error": str(e)}
 
-    def is_available(self) -> bool:
+    async def is_available(self) -> bool:
         """Check if cache is available
 
         Returns:
@@ -328,7 +610,15 @@ class CacheManager:
             return False
 
         try:
-            self.redis_client.ping()
+            await self.redis_client.ping()
             return True
         except Exception:
             return False
+
+    async def close(self) -> None:
+        """Flush pending background writes and close the shared connection pool"""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        if self.redis_client:
+            await self.redis_client.connection_pool.disconnect()
+            logger.info("Cache manager connections closed")
@@ -7,7 +7,8 @@ default values when environment variables are not set.
 """
 
 import os
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -32,9 +33,26 @@ READER_API_KEY = os.getenv("READER_API_KEY", "")
 
 # Crawler Configuration
 DEFAULT_SEARCH_LIMIT = int(os.getenv("DEFAULT_SEARCH_LIMIT", "10"))
+MAX_SEARCH_LIMIT = int(os.getenv("MAX_SEARCH_LIMIT", "50"))
 CONTENT_FILTER_THRESHOLD = float(os.getenv("CONTENT_FILTER_THRESHOLD", "0.6"))
 WORD_COUNT_THRESHOLD = int(os.getenv("WORD_COUNT_THRESHOLD", "10"))
 CRAWLER_POOL_SIZE = int(os.getenv("CRAWLER_POOL_SIZE", "4"))
+CRAWLER_SLOTS = int(os.getenv("CRAWLER_SLOTS", "4"))
+# Crawlers launched at startup and kept warm; the pool grows on demand up to
+# CRAWLER_POOL_SIZE and shrinks back once the extra ones sit idle
+MIN_CRAWLERS = min(int(os.getenv("MIN_CRAWLERS", "1")), CRAWLER_POOL_SIZE)
+CRAWLER_IDLE_TIMEOUT = float(os.getenv("CRAWLER_IDLE_TIMEOUT", "300"))
+# Seconds a request waits for a free crawler slot before getting HTTP 503
+POOL_WAIT_TIMEOUT_S = float(os.getenv("POOL_WAIT_TIMEOUT_S", "30"))
+# Search requests admitted at once before new ones get HTTP 429; defaults to
+# enough for every crawler slot plus an equal number waiting for one
+MAX_INFLIGHT_SEARCHES = int(
+    os.getenv("MAX_INFLIGHT_SEARCHES", str(CRAWLER_POOL_SIZE * CRAWLER_SLOTS * 2))
+)
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "8"))
+CRAWL_MEMORY_THRESHOLD = float(os.getenv("CRAWL_MEMORY_THRESHOLD", "75.0"))
+# Pages fetched from one domain at once, across all concurrent requests
+CRAWL_DOMAIN_CONCURRENCY = int(os.getenv("CRAWL_DOMAIN_CONCURRENCY", "4"))
 
 # Cache Configuration
 CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
@@ -71,48 +89,65 @@ PROXY_LIST = os.getenv("PROXY_LIST", "").strip()
 CUSTOM_USER_AGENTS = os.getenv("CUSTOM_USER_AGENTS", "").strip()
 
 
-def get_config_info() -> Dict[str, Any]:
-    """Returns a dictionary of current configuration information
+# Configuration snapshot built once at import time; values above never change at runtime
+_CONFIG_INFO: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "searxng": MappingProxyType({
+        "host": SEARXNG_HOST,
+        "port": SEARXNG_PORT,
+        "base_path": SEARXNG_BASE_PATH,
+        "api_base": SEARXNG_API_BASE
+    }),
+    "api": MappingProxyType({
+        "host": API_HOST,
+        "port": API_PORT
+    }),
+    "reader": MappingProxyType({
+        "enabled": READER_ENABLED,
+        "url": READER_URL
+    }),
+    "crawler": MappingProxyType({
+        "default_search_limit": DEFAULT_SEARCH_LIMIT,
+        "max_search_limit": MAX_SEARCH_LIMIT,
+        "content_filter_threshold": CONTENT_FILTER_THRESHOLD,
+        "word_count_threshold": WORD_COUNT_THRESHOLD,
+        "pool_size": CRAWLER_POOL_SIZE,
+        "slots_per_crawler": CRAWLER_SLOTS,
+        "min_crawlers": MIN_CRAWLERS,
+        "crawler_idle_timeout": CRAWLER_IDLE_TIMEOUT,
+        "pool_wait_timeout": POOL_WAIT_TIMEOUT_S,
+        "max_inflight_searches": MAX_INFLIGHT_SEARCHES,
+        "crawl_concurrency": CRAWL_CONCURRENCY,
+        "crawl_memory_threshold": CRAWL_MEMORY_THRESHOLD,
+        "crawl_domain_concurrency": CRAWL_DOMAIN_CONCURRENCY
+    }),
+    "search_engines": MappingProxyType({
+        "disabled": DISABLED_ENGINES,
+        "enabled": ENABLED_ENGINES
+    }),
+    "anti_crawl": MappingProxyType({
+        "enabled": ANTI_CRAWL_ENABLED,
+        "enable_proxy_rotation": ENABLE_PROXY_ROTATION,
+        "enable_user_agent_rotation": ENABLE_USER_AGENT_ROTATION,
+        "enable_request_delay": ENABLE_REQUEST_DELAY,
+        "enable_random_headers": ENABLE_RANDOM_HEADERS,
+        "enable_browser_headers": ENABLE_BROWSER_HEADERS,
+        "min_request_delay": MIN_REQUEST_DELAY,
+        "max_request_delay": MAX_REQUEST_DELAY,
+        "proxy_rotation_mode": PROXY_ROTATION_MODE,
+        "use_mobile_agents": USE_MOBILE_AGENTS,
+        "proxy_count": len(PROXY_LIST.split(",")) if PROXY_LIST else 0,
+        "custom_user_agents_count": len(CUSTOM_USER_AGENTS.split(",")) if CUSTOM_USER_AGENTS else 0
+    })
+})
+
+
+def get_config_info() -> Mapping[str, Mapping[str, Any]]:
+    """Returns a read-only mapping of current configuration information
+
+    The snapshot is built once at import time; callers that need a mutable
+    copy must copy it explicitly.
 
     Returns:
-        dict: Dictionary containing all configuration parameters
+        Mapping: Read-only mapping containing all configuration parameters
     """
-    return {
-        "searxng": {
-            "host": SEARXNG_HOST,
-            "port": SEARXNG_PORT,
-            "base_path": SEARXNG_BASE_PATH,
-            "api_base": SEARXNG_API_BASE
-        },
-        "api": {
-            "host": API_HOST,
-            "port": API_PORT
-        },
-        "reader": {
-            "enabled": READER_ENABLED,
-            "url": READER_URL
-        },
-        "crawler": {
-            "default_search_limit": DEFAULT_SEARCH_LIMIT,
-            "content_filter_threshold": CONTENT_FILTER_THRESHOLD,
-            "word_count_threshold": WORD_COUNT_THRESHOLD
-        },
-        "search_engines": {
-            "disabled": DISABLED_ENGINES,
-            "enabled": ENABLED_ENGINES
-        },
-        "anti_crawl": {
-            "enabled": ANTI_CRAWL_ENABLED,
-            "enable_proxy_rotation": ENABLE_PROXY_ROTATION,
-            "enable_user_agent_rotation": ENABLE_USER_AGENT_ROTATION,
-            "enable_request_delay": ENABLE_REQUEST_DELAY,
-            "enable_random_headers": ENABLE_RANDOM_HEADERS,
-            "enable_browser_headers": ENABLE_BROWSER_HEADERS,
-            "min_request_delay": MIN_REQUEST_DELAY,
-            "max_request_delay": MAX_REQUEST_DELAY,
-            "proxy_rotation_mode": PROXY_ROTATION_MODE,
-            "use_mobile_agents": USE_MOBILE_AGENTS,
-            "proxy_count": len(PROXY_LIST.split(",")) if PROXY_LIST else 0,
-            "custom_user_agents_count": len(CUSTOM_USER_AGENTS.split(",")) if CUSTOM_USER_AGENTS else 0
-        }
-    }
\ No newline at end of file
+    return _CONFIG_INFO
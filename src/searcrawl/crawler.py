@@ -7,21 +7,25 @@ It encapsulates the AsyncWebCrawler from crawl4ai library and provides
 high-level methods for crawling web pages and processing their content.
 """
 
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from typing import List, Dict, Any, Optional, AsyncGenerator, AsyncIterator
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from crawl4ai import (
     AsyncWebCrawler,
     BrowserConfig,
     CrawlerRunConfig,
     CacheMode,
+    MemoryAdaptiveDispatcher,
+    RateLimiter,
 )
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 from crawl4ai.content_filter_strategy import PruningContentFilter
-import markdown
-from bs4 import BeautifulSoup
-import re
 import httpx
-import json
+import orjson
 import asyncio
+import ipaddress
+import random
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from fastapi import HTTPException
 from loguru import logger
 
@@ -48,7 +52,11 @@ from .config import (
     PROXY_LIST,
     CUSTOM_USER_AGENTS,
     READER_ENABLED,
+    CRAWL_CONCURRENCY,
+    CRAWL_MEMORY_THRESHOLD,
+    CRAWL_DOMAIN_CONCURRENCY,
 )
+from . import _markdown_fast
 from .reader import fetch_with_reader
 from .cache import CacheManager
 from .anti_crawl import (
@@ -57,6 +65,246 @@ from .anti_crawl import (
     ProxyType
 )
 
+# Seconds to collect failed URLs before dispatching them as one retry batch
+RETRY_BATCH_INTERVAL = 0.5
+
+# Domains whose concurrency slots are remembered; idle ones beyond this are evicted
+DOMAIN_SLOTS_MAX_DOMAINS = 1024
+
+# SearXNG attempts per search, responses worth retrying, and the longest
+# backoff between attempts in seconds
+SEARXNG_RETRY_ATTEMPTS = 4
+SEARXNG_RETRY_STATUSES = frozenset({429, 502, 503})
+SEARXNG_RETRY_MAX_DELAY = 30.0
+
+# Shared HTTP client reused across SearXNG requests for connection keep-alive
+_searxng_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_searxng_client() -> httpx.AsyncClient:
+    """Get or lazily create the shared SearXNG HTTP client
+
+    Returns:
+        httpx.AsyncClient: Connection-pooled client kept alive between searches
+    """
+    global _searxng_client
+    if _searxng_client is None or _searxng_client.is_closed:
+        _searxng_client = httpx.AsyncClient(
+            base_url=f"http://{SEARXNG_HOST}:{SEARXNG_PORT}",
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0
+            ),
+            timeout=httpx.Timeout(10.0)
+        )
+    return _searxng_client
+
+
+def _searxng_retry_delay(attempt: int, response: httpx.Response) -> float:
+    """Seconds to wait before retrying a SearXNG request
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        response: Throttled response, whose Retry-After seconds are honored
+
+    Returns:
+        float: Exponential backoff with jitter, capped at SEARXNG_RETRY_MAX_DELAY
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), SEARXNG_RETRY_MAX_DELAY)
+    # Jitter keeps concurrent searches from retrying in lockstep
+    return min(2 ** attempt + random.random(), SEARXNG_RETRY_MAX_DELAY)
+
+
+async def _searxng_with_retry(**kwargs: Any) -> httpx.Response:
+    """POST to SearXNG, retrying throttled or temporarily unavailable responses
+
+    Args:
+        **kwargs: Arguments passed on to the client's post()
+
+    Returns:
+        httpx.Response: The first successful response
+
+    Raises:
+        httpx.HTTPStatusError: If SearXNG answers with an error status, or keeps
+            throttling after SEARXNG_RETRY_ATTEMPTS attempts
+        httpx.TransportError: If SearXNG cannot be reached
+    """
+    client = _get_searxng_client()
+    for attempt in range(SEARXNG_RETRY_ATTEMPTS - 1):
+        response = await client.post(SEARXNG_BASE_PATH, **kwargs)
+        if response.status_code not in SEARXNG_RETRY_STATUSES:
+            response.raise_for_status()
+            return response
+        delay = _searxng_retry_delay(attempt, response)
+        logger.warning("SearXNG returned {}, retrying in {:.1f}s", response.status_code, delay)
+        await asyncio.sleep(delay)
+
+    # Final attempt: whatever it returns or raises is the outcome
+    response = await client.post(SEARXNG_BASE_PATH, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+class _DomainSlot:
+    """Concurrency limit for one domain, and how many tasks hold or await it"""
+
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+class DomainSlots:
+    """Per-domain concurrency limits shared by every crawl
+
+    Keeps one semaphore per domain in least recently used order. Once more
+    than max_domains are tracked, the oldest domains nobody holds or awaits
+    are forgotten, so memory stays bounded in a long-running service.
+    """
+
+    def __init__(self, limit: int, max_domains: int = DOMAIN_SLOTS_MAX_DOMAINS):
+        """Initialize the limits
+
+        Args:
+            limit: Pages fetched from one domain at once
+            max_domains: Idle domains remembered before the oldest are evicted
+        """
+        self.limit = limit
+        self.max_domains = max_domains
+        self._domains: "OrderedDict[str, _DomainSlot]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def _evict(self) -> None:
+        """Forget the least recently used idle domains beyond max_domains"""
+        excess = len(self._domains) - self.max_domains
+        if excess <= 0:
+            return
+        # Domains still in use stay, so the map may briefly exceed the cap
+        idle = [domain for domain, slot in self._domains.items() if not slot.users][:excess]
+        for domain in idle:
+            del self._domains[domain]
+
+    @asynccontextmanager
+    async def acquire(self, url: str) -> AsyncIterator[None]:
+        """Hold one of the slots of the URL's domain
+
+        Args:
+            url: URL about to be fetched
+        """
+        domain = urlsplit(url).netloc.lower()
+        slot = self._domains.get(domain)
+        if slot is None:
+            slot = self._domains[domain] = _DomainSlot(self.limit)
+        else:
+            self._domains.move_to_end(domain)
+        slot.users += 1
+        self._evict()
+        try:
+            async with slot.semaphore:
+                yield
+        finally:
+            slot.users -= 1
+
+
+# Shared across concurrent requests so a domain appearing in several searches
+# is not fetched more than CRAWL_DOMAIN_CONCURRENCY times at once
+_domain_slots = DomainSlots(CRAWL_DOMAIN_CONCURRENCY)
+
+
+class _DomainLimitedDispatcher(MemoryAdaptiveDispatcher):
+    """MemoryAdaptiveDispatcher that also holds a domain slot per page"""
+
+    async def crawl_url(self, url: str, config: CrawlerRunConfig, task_id: str, retry_count: int = 0) -> Any:
+        async with _domain_slots.acquire(url):
+            return await super().crawl_url(url, config, task_id, retry_count)
+
+
+async def _fetch_with_reader_limited(url: str) -> Optional[Dict[str, Any]]:
+    """Fetch a URL through the Reader service while holding its domain slot
+
+    Args:
+        url: URL to fetch
+
+    Returns:
+        Optional[Dict[str, Any]]: Reader result, or None if the fetch failed
+    """
+    async with _domain_slots.acquire(url):
+        return await fetch_with_reader(url)
+
+
+async def close_searxng_client() -> None:
+    """Close the shared SearXNG HTTP client and release its connections"""
+    global _searxng_client
+    if _searxng_client is not None:
+        await _searxng_client.aclose()
+        _searxng_client = None
+        logger.info("SearXNG HTTP client closed")
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so equivalent spellings compare equal
+
+    Lowercases the scheme and host, drops the fragment and sorts query
+    parameters. Used only for duplicate detection; the original URL is
+    what gets crawled and reported.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        str: Canonical form of the URL
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def is_crawlable_url(url: str) -> bool:
+    """Check whether a URL points at a public web page worth crawling
+
+    Only http(s) URLs with a host name are accepted; IP-literal hosts are
+    rejected since search results never legitimately link to them.
+
+    Args:
+        url: URL to check
+
+    Returns:
+        bool: True if the URL may be handed to the crawler
+    """
+    try:
+        parts = urlsplit(url.strip())
+        host = parts.hostname
+    except ValueError:
+        return False
+    if parts.scheme.lower() not in ("http", "https") or not host:
+        return False
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return True
+    return False
+
+
+def dedupe_urls(urls: List[str]) -> List[str]:
+    """Remove duplicate URLs while preserving order
+
+    Args:
+        urls: List of URLs, possibly containing equivalent duplicates
+
+    Returns:
+        List[str]: First occurrence of each distinct URL, in original order
+    """
+    unique: Dict[str, str] = {}
+    for url in urls:
+        unique.setdefault(canonicalize_url(url), url)
+    return list(unique.values())
+
 
 class WebCrawler:
     """Web crawler class that encapsulates web crawling and content processing functionality"""
@@ -69,6 +317,8 @@ class WebCrawler:
             anti_crawl_config: Optional anti-crawl configuration for evasion techniques
         """
         self.crawler: Optional[AsyncWebCrawler] = None
+        # Built once in initialize(); holds no per-request state
+        self.run_config: Optional[CrawlerRunConfig] = None
         self.cache_manager = cache_manager
         self.anti_crawl_config = anti_crawl_config or self._create_default_anti_crawl_config()
         logger.info("Initializing WebCrawler instance")
@@ -144,6 +394,35 @@ class WebCrawler:
             proxies=proxies
         )
 
+    @staticmethod
+    def _build_run_config() -> CrawlerRunConfig:
+        """Build the crawler run configuration shared by every crawl
+
+        Returns:
+            CrawlerRunConfig: Run configuration with the markdown generator attached
+        """
+        # Configure Markdown generator
+        md_generator = DefaultMarkdownGenerator(
+            content_filter=PruningContentFilter(threshold=CONTENT_FILTER_THRESHOLD),
+            options={
+                "ignore_links": True,
+                "ignore_images": True,
+                "escape_html": False,
+            }
+        )
+
+        # Configure crawler run parameters
+        return CrawlerRunConfig(
+            word_count_threshold=WORD_COUNT_THRESHOLD,
+            exclude_external_links=True,
+            remove_overlay_elements=True,
+            excluded_tags=['img', 'header', 'footer', 'iframe', 'nav'],
+            process_iframes=True,
+            markdown_generator=md_generator,
+            cache_mode=CacheMode.BYPASS,
+            stream=True
+        )
+
     async def initialize(self) -> None:
         """Initialize AsyncWebCrawler instance
 
@@ -179,6 +458,8 @@ class WebCrawler:
             # Configure browser without anti-crawl settings
             browser_config = BrowserConfig(headless=True, verbose=False)
         
+        self.run_config = self._build_run_config()
+
         # Initialize crawler
         self.crawler = await AsyncWebCrawler(config=browser_config).__aenter__()
         logger.info("AsyncWebCrawler initialization completed with anti-crawl features")
@@ -199,31 +480,11 @@ class WebCrawler:
         Returns:
             str: Converted plain text
         """
-        # Remove heading symbols
-        text = re.sub(r'#+\s*', '', markdown_str)
-
-        # Remove links and images
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-
-        # Remove bold, italic, and other emphasis markers
-        text = re.sub(r'(\*\*|__)(.*?)\1', r'\2', text)
-        text = re.sub(r'(\*|_)(.*?)\1', r'\2', text)
-
-        # Remove list markers
-        text = re.sub(r'^[\*\-\+]\s*', '', text, flags=re.MULTILINE)
-
-        # Remove code blocks
-        text = re.sub(r'`{3}.*?`{3}', '', text, flags=re.DOTALL)
-        text = re.sub(r'`(.*?)`', r'\1', text)
-
-        # Remove quote blocks
-        text = re.sub(r'^>\s*', '', text, flags=re.MULTILINE)
-
-        return text.strip()
+        return _markdown_fast.markdown_to_text_regex(markdown_str)
 
     @staticmethod
     def markdown_to_text(markdown_str: str) -> str:
-        """Convert Markdown text to plain text using markdown and BeautifulSoup libraries
+        """Convert Markdown text to plain text using mistune and selectolax libraries
 
         Args:
             markdown_str: Markdown formatted text
@@ -231,18 +492,19 @@ class WebCrawler:
         Returns:
             str: Converted plain text
         """
-        html = markdown.markdown(markdown_str, extensions=['fenced_code'])
-        # Extract plain text using BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
+        return _markdown_fast.markdown_to_text(markdown_str)
 
-        text = soup.get_text(separator="\n")  # Preserve paragraph line breaks
+    @staticmethod
+    def html_to_text(html: str) -> str:
+        """Convert HTML to plain text using the selectolax library
 
-        # Clean up extra blank lines
-        cleaned_text = "\n".join([
-            line.strip() for line in text.split("\n") if line.strip()
-        ])
+        Args:
+            html: HTML formatted text
 
-        return cleaned_text
+        Returns:
+            str: Converted plain text
+        """
+        return _markdown_fast.html_to_text(html)
 
     @staticmethod
     async def make_searxng_request(
@@ -283,14 +545,11 @@ class WebCrawler:
                 'Host': f'{SEARXNG_HOST}:{SEARXNG_PORT}',
                 'Connection': 'keep-alive',
             }
-            
-            url = f"http://{SEARXNG_HOST}:{SEARXNG_PORT}{SEARXNG_BASE_PATH}"
 
-            async with httpx.AsyncClient() as client:
-                logger.info(f"Sending search request to SearXNG: {query}")
-                response = await client.post(url, data=form_data, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            logger.info("Sending search request to SearXNG: {}", query)
+            response = await _searxng_with_retry(data=form_data, headers=headers)
+            # Decode the raw body with orjson rather than httpx's stdlib json
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             logger.error(f"SearXNG request failed with status {e.response.status_code}: {e.response.text}")
             raise Exception(f"Search request failed: {e.response.text}")
@@ -298,250 +557,329 @@ class WebCrawler:
             logger.error(f"SearXNG request failed: {str(e)}")
             raise Exception(f"Search request failed: {str(e)}")
 
-    async def crawl_urls(self, urls: List[str], instruction: str) -> Dict[str, Any]:
-        """Crawl multiple URLs and process content
+    @staticmethod
+    def _process_result(result: Any, url: str) -> Optional[Dict[str, str]]:
+        """Extract the filtered content from a single crawl result
+
+        The pruned HTML is preferred so it can be converted to text directly,
+        falling back to the pruned markdown when no HTML is available.
 
         Args:
-            urls: List of URLs to crawl
-            instruction: Crawling instruction, typically a search query
+            result: Crawl result returned by crawl4ai, may be None
+            url: The URL the result belongs to
 
         Returns:
-            Dict[str, Any]: Dictionary containing processed content, success count, and failed URLs
+            Dict or None: Entry with an 'html' or 'content' (markdown) key and
+                'reference', or None if the crawl failed
+        """
+        if result is None:
+            logger.debug("URL crawl result is None: {}", url)
+            return None
 
-        Raises:
-            HTTPException: Raised when all URL crawls fail
+        # CrawlResult always carries these attributes, so read them directly
+        # and treat a missing one as a failed crawl
+        try:
+            success = result.success
+            markdown_result = result.markdown
+        except AttributeError:
+            success = False
+        if not success:
+            logger.debug("URL crawl failed or result missing success flag: {}", url)
+            return None
+
+        try:
+            fit_html = markdown_result.fit_html
+            if fit_html:
+                return {"html": fit_html, "reference": url}
+
+            fit_markdown = markdown_result.fit_markdown
+            if fit_markdown:
+                return {"content": fit_markdown, "reference": url}
+        except AttributeError:
+            pass
+
+        logger.debug("URL crawl result missing content: {}", url)
+        return None
+
+    async def _arun_stream(self, urls: List[str], run_config: CrawlerRunConfig) -> AsyncGenerator[Any, None]:
+        """Crawl URLs with crawl4ai, yielding results as they complete
+
+        Args:
+            urls: List of URLs to crawl
+            run_config: Crawler run configuration with stream mode enabled
+
+        Yields:
+            Crawl results in completion order
+        """
+        # Ensure crawler is initialized
+        if not self.crawler:
+            raise RuntimeError("Crawler not initialized")
+
+        # Cap open pages per call and per domain, and hold back new ones under
+        # memory pressure. Backoff state is per call, so a throttled site only
+        # slows down the request that hit it.
+        dispatcher = _DomainLimitedDispatcher(
+            memory_threshold_percent=CRAWL_MEMORY_THRESHOLD,
+            max_session_permit=CRAWL_CONCURRENCY,
+            rate_limiter=RateLimiter(base_delay=(1.0, 3.0), max_delay=60.0, max_retries=3),
+        )
+        crawl_result = await self.crawler.arun_many(urls=urls, config=run_config, dispatcher=dispatcher)
+
+        # run_config always has stream mode enabled, so arun_many hands back an async generator
+        async for result in crawl_result:  # type: ignore
+            yield result
+
+    async def _crawl_with_retry(self, urls: List[str], run_config: CrawlerRunConfig) -> AsyncGenerator[Dict[str, str], None]:
+        """Crawl URLs, retrying failures while the first pass is still running
+
+        Failed URLs from the first pass are queued and re-crawled in batches
+        every RETRY_BATCH_INTERVAL seconds, overlapping with in-flight crawls.
+
+        Args:
+            urls: List of URLs to crawl
+            run_config: Crawler run configuration with stream mode enabled
+
+        Yields:
+            Dict[str, str]: Successfully crawled entries in completion order
         """
+        output: asyncio.Queue = asyncio.Queue()
+        retry_queue: asyncio.Queue = asyncio.Queue()
+        requested = set(urls)
+
+        def process(result: Any, is_retry: bool) -> Optional[Dict[str, str]]:
+            url = getattr(result, 'url', None)
+            if url not in requested:
+                logger.debug("Ignoring crawl result for unrequested URL: {}", url)
+                return None
+            try:
+                entry = self._process_result(result, url)
+            except Exception as e:
+                entry = None
+                logger.warning("URL crawl {} failed: {}, error: {}", "retry" if is_retry else "attempt", url, e)
+            if entry is not None:
+                output.put_nowait(entry)
+                logger.info("Successfully crawled URL{}: {}", " on retry" if is_retry else "", url)
+            return entry
+
+        async def first_pass() -> None:
+            try:
+                async for result in self._arun_stream(urls, run_config):
+                    if process(result, is_retry=False) is None and getattr(result, 'url', None) in requested:
+                        # Record URLs that need retry
+                        retry_queue.put_nowait(result.url)
+            finally:
+                # Sentinel telling the retry loop that no more failures will arrive
+                retry_queue.put_nowait(None)
+
+        async def retry_pass() -> None:
+            loop = asyncio.get_running_loop()
+            finished = False
+            while not finished:
+                first = await retry_queue.get()
+                if first is None:
+                    # Nothing (more) failed, so there is nothing to wait for
+                    return
+
+                # Collect failures for up to RETRY_BATCH_INTERVAL, stopping early
+                # once the first pass reports that it has finished
+                retry_urls = [first]
+                deadline = loop.time() + RETRY_BATCH_INTERVAL
+                while (remaining := deadline - loop.time()) > 0:
+                    try:
+                        url = await asyncio.wait_for(retry_queue.get(), timeout=remaining)
+                    except (asyncio.TimeoutError, TimeoutError):
+                        break
+                    if url is None:
+                        finished = True
+                        break
+                    retry_urls.append(url)
+
+                logger.opt(lazy=True).info("Retrying failed URLs: {}", lambda: ", ".join(retry_urls))
+                async for result in self._arun_stream(retry_urls, run_config):
+                    process(result, is_retry=True)
+
+        async def run_passes() -> None:
+            try:
+                await asyncio.gather(first_pass(), retry_pass())
+            finally:
+                # Sentinel telling the consumer that crawling has finished
+                output.put_nowait(None)
+
+        passes = asyncio.create_task(run_passes())
         try:
-            # Check if crawler has been initialized
-            if not self.crawler:
-                logger.warning("Crawler not initialized, auto-initializing")
-                await self.initialize()
+            while (entry := await output.get()) is not None:
+                yield entry
+            # Surface any crawl error once all successful entries were yielded
+            await passes
+        finally:
+            if not passes.done():
+                passes.cancel()
+
+    @classmethod
+    def _to_plain_text(cls, entry: Dict[str, str]) -> Dict[str, str]:
+        """Convert a crawled or Reader entry to its plain text result
 
-            # Check cache first if cache manager is available
-            cached_results = []
-            urls_to_process = []
-            
-            if self.cache_manager and self.cache_manager.is_available():
-                logger.info(f"Checking cache for {len(urls)} URLs")
-                cache_hits = self.cache_manager.get_batch(urls, instruction)
-                
-                for url in urls:
-                    cached_data = cache_hits.get(url)
-                    if cached_data:
-                        cached_results.append({
-                            "content": cached_data.get("content"),
-                            "reference": cached_data.get("reference")
-                        })
-                        logger.info(f"Cache hit for URL: {url}")
-                    else:
-                        urls_to_process.append(url)
-                
-                logger.info(f"Cache hits: {len(cached_results)}, URLs to process: {len(urls_to_process)}")
-            else:
-                urls_to_process = urls
-                logger.info("Cache not available, processing all URLs")
+        Args:
+            entry: Entry with an 'html' or 'content' (markdown) key and 'reference'
+
+        Returns:
+            Dict[str, str]: Result with 'content' (plain text) and 'reference'
+        """
+        # Crawl4AI HTML goes straight to text; Reader markdown is rendered first.
+        # Both already yield plain text, so no regex stripping pass follows.
+        if "html" in entry:
+            plain_text = cls.html_to_text(entry["html"])
+        else:
+            plain_text = cls.markdown_to_text(entry["content"])
+        return {"content": plain_text, "reference": entry["reference"]}
+
+    async def crawl_urls_stream(
+        self, urls: List[str], instruction: str, check_cache: bool = True
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Crawl multiple URLs, yielding each processed result as soon as it is ready
+
+        Cached results are yielded first, followed by newly fetched pages in
+        completion order. Newly fetched results are written back to the cache
+        once the stream ends, including when the consumer stops early.
 
-            # If all URLs are cached, return cached results
-            if not urls_to_process:
-                logger.info("All URLs found in cache, returning cached results")
-                return {
-                    "results": cached_results,
-                    "success_count": len(cached_results),
-                    "failed_urls": [],
-                    "cache_hits": len(cached_results)
-                }
+        Args:
+            urls: List of URLs to crawl
+            instruction: Crawling instruction, typically a search query
+            check_cache: Whether to look up URLs in the cache first; False when
+                the caller already filtered out cached URLs
+
+        Yields:
+            Dict[str, Any]: Result with 'content', 'reference' and 'cached' keys
+        """
+        # Check if crawler has been initialized
+        if not self.crawler:
+            logger.warning("Crawler not initialized, auto-initializing")
+            await self.initialize()
+
+        # Drop duplicate URLs before the cache lookup and browser navigation
+        urls = dedupe_urls(urls)
+        urls_to_process = urls
+
+        # get_batch already degrades to all-misses when Redis is unreachable,
+        # so no separate PING round-trip is spent before the MGET
+        if self.cache_manager and check_cache:
+            logger.info(f"Checking cache for {len(urls)} URLs")
+            cache_hits = await self.cache_manager.get_batch(urls, instruction)
+
+            urls_to_process = []
+            for url in urls:
+                cached_data = cache_hits.get(url)
+                if cached_data:
+                    logger.info("Cache hit for URL: {}", url)
+                    yield {
+                        "content": cached_data.get("content"),
+                        "reference": cached_data.get("reference"),
+                        "cached": True
+                    }
+                else:
+                    urls_to_process.append(url)
 
-            all_results = []
-            failed_urls = []
+            logger.info(f"Cache hits: {len(urls) - len(urls_to_process)}, URLs to process: {len(urls_to_process)}")
+        else:
+            logger.info("Cache lookup skipped, processing all URLs")
 
-            all_results = []
-            failed_urls = []
+        # If all URLs are cached, there is nothing left to fetch
+        if not urls_to_process:
+            logger.info("All URLs found in cache, returning cached results")
+            return
 
+        processed_results: List[Dict[str, str]] = []
+        reader_tasks: List[asyncio.Task] = []
+        try:
             if READER_ENABLED:
                 # --- Jina Reader Path ---
                 logger.info(f"Using Jina Reader service for {len(urls_to_process)} URLs")
-                tasks = [fetch_with_reader(url) for url in urls_to_process]
-                reader_results = await asyncio.gather(*tasks)
-                
-                for result in reader_results:
-                    if result:
-                        all_results.append(result)
-                    # In a strict either/or setup, we don't fallback, so we just log failures.
-                    # The failed URLs will be collected at the end.
-
+                reader_tasks = [asyncio.create_task(_fetch_with_reader_limited(url)) for url in urls_to_process]
+
+                # In a strict either/or setup, we don't fallback, so failed fetches are skipped
+                for next_done in asyncio.as_completed(reader_tasks):
+                    entry = await next_done
+                    if entry:
+                        result = await asyncio.to_thread(self._to_plain_text, entry)
+                        processed_results.append(result)
+                        yield {**result, "cached": False}
             else:
                 # --- Crawl4AI Path ---
                 urls_to_crawl = urls_to_process
                 logger.info(f"Using Crawl4AI for {len(urls_to_crawl)} URLs")
-                
-                # Configure Markdown generator
-                md_generator = DefaultMarkdownGenerator(
-                    content_filter=PruningContentFilter(threshold=CONTENT_FILTER_THRESHOLD),
-                    options={
-                        "ignore_links": True,
-                        "ignore_images": True,
-                        "escape_html": False,
-                    }
-                )
-
-                # Configure crawler run parameters
-                run_config = CrawlerRunConfig(
-                    word_count_threshold=WORD_COUNT_THRESHOLD,
-                    exclude_external_links=True,
-                    remove_overlay_elements=True,
-                    excluded_tags=['img', 'header', 'footer', 'iframe', 'nav'],
-                    process_iframes=True,
-                    markdown_generator=md_generator,
-                    cache_mode=CacheMode.BYPASS
-                )
-
-                logger.info(f"Starting to crawl URLs: {', '.join(urls_to_crawl)}")
-                
+                logger.opt(lazy=True).info("Starting to crawl URLs: {}", lambda: ", ".join(urls_to_crawl))
+
                 # Apply anti-crawl delay before crawling
                 if ANTI_CRAWL_ENABLED and self.anti_crawl_config.enable_request_delay:
                     self.anti_crawl_config.apply_delay()
-                
-                # Ensure crawler is initialized
-                if not self.crawler:
-                    raise RuntimeError("Crawler not initialized")
-                
-                # Crawl URLs and get results
-                crawl_result = await self.crawler.arun_many(urls=urls_to_crawl, config=run_config)
-                
-                # Convert to list if it's an async generator
-                results: list = []
-                if hasattr(crawl_result, '__aiter__'):
-                    async for result in crawl_result:  # type: ignore
-                        results.append(result)
-                else:
-                    results = list(crawl_result) if crawl_result else []  # type: ignore
-
-                # Create a list to store crawl results from all successful URLs
-                retry_urls = []
 
-                # First crawl attempt processing
-                for i, result in enumerate(results):
-                    try:
-                        if result is None:
-                            logger.debug(f"URL crawl result is None: {urls_to_crawl[i]}")
-                            retry_urls.append(urls_to_crawl[i])
-                            continue
-
-                        if not hasattr(result, 'success'):
-                            logger.debug(f"URL crawl result missing success attribute: {urls_to_crawl[i]}")
-                            retry_urls.append(urls_to_crawl[i])
-                            continue
-
-                        if result.success:
-                            if not hasattr(result, 'markdown') or not hasattr(result.markdown, 'fit_markdown'):
-                                logger.debug(f"URL crawl result missing markdown content: {urls_to_crawl[i]}")
-                                retry_urls.append(urls_to_crawl[i])
-                                continue
-
-                            # Add successful result's markdown content to the list
-                            all_results.append({
-                                "content": result.markdown.fit_markdown,
-                                "reference": urls_to_crawl[i]
-                            })
-                            logger.info(f"Successfully crawled URL: {urls_to_crawl[i]}")
-                        else:
-                            logger.debug(f"URL crawl failed: {urls_to_crawl[i]}")
-                            retry_urls.append(urls_to_crawl[i])
-                    except Exception as e:
-                        # Record URLs that need retry
-                        retry_urls.append(urls_to_crawl[i])
-                        error_msg = str(e)
-                        logger.warning(f"URL first crawl attempt failed: {urls_to_crawl[i]}, error: {error_msg}")
-
-                # If there are URLs to retry, perform second crawl attempt
-                if retry_urls:
-                    logger.info(f"Retrying failed URLs: {', '.join(retry_urls)}")
-                    
-                    # Crawl retry URLs and get results
-                    retry_crawl_result = await self.crawler.arun_many(urls=retry_urls, config=run_config)
-                    
-                    # Convert to list if it's an async generator
-                    retry_results: list = []
-                    if hasattr(retry_crawl_result, '__aiter__'):
-                        async for result in retry_crawl_result:  # type: ignore
-                            retry_results.append(result)
-                    else:
-                        retry_results = list(retry_crawl_result) if retry_crawl_result else []  # type: ignore
-
-                    for i, result in enumerate(retry_results):
-                        try:
-                            if result is None:
-                                logger.debug(f"Retry URL crawl result is None: {retry_urls[i]}")
-                                failed_urls.append(retry_urls[i])
-                                continue
-
-                            if not hasattr(result, 'success'):
-                                logger.debug(f"Retry URL crawl result missing success attribute: {retry_urls[i]}")
-                                failed_urls.append(retry_urls[i])
-                                continue
-
-                            if result.success:
-                                if not hasattr(result, 'markdown') or not hasattr(result.markdown, 'fit_markdown'):
-                                    logger.debug(f"Retry URL crawl result missing markdown content: {retry_urls[i]}")
-                                    failed_urls.append(retry_urls[i])
-                                    continue
-
-                                # Add successful retry result to the list
-                                all_results.append({
-                                    "content": result.markdown.fit_markdown,
-                                    "reference": retry_urls[i]
-                                })
-                                logger.info(f"Successfully crawled URL on retry: {retry_urls[i]}")
-                            else:
-                                logger.debug(f"Retry URL crawl still failed: {retry_urls[i]}")
-                                failed_urls.append(retry_urls[i])
-                        except Exception as e:
-                            # Record finally failed URLs
-                            failed_urls.append(retry_urls[i])
-                            error_msg = str(e)
-                            logger.error(f"URL second crawl attempt failed: {retry_urls[i]}, error: {error_msg}")
-            
-            # Consolidate failed URLs
-            crawled_urls = {res["reference"] for res in all_results}
-            failed_urls.extend([url for url in urls_to_process if url not in crawled_urls])
-
-            if not all_results:
-                logger.error("All URL crawls failed")
-                raise HTTPException(status_code=500, detail="All URL crawls failed")
-
-            # Process each result to convert markdown to plain text
-            processed_results = []
-            for result in all_results:
-                plain_text = self.markdown_to_text_regex(self.markdown_to_text(result["content"]))
-                processed_results.append({
-                    "content": plain_text,
-                    "reference": result["reference"]
-                })
+                # Crawl URLs, retrying failed ones once more as they are reported
+                async for entry in self._crawl_with_retry(urls_to_crawl, self.run_config):
+                    # Convert in a worker thread so the loop keeps pumping crawl results
+                    result = await asyncio.to_thread(self._to_plain_text, entry)
+                    processed_results.append(result)
+                    yield {**result, "cached": False}
+        finally:
+            for task in reader_tasks:
+                task.cancel()
 
             # Cache newly crawled results
-            if self.cache_manager and self.cache_manager.is_available() and processed_results:
-                cache_items = []
-                for result in processed_results:
-                    cache_items.append({
+            if self.cache_manager and processed_results:
+                cache_items = [
+                    {
                         "url": result["reference"],
                         "content": result["content"],
                         "reference": result["reference"]
-                    })
-                cached_count = self.cache_manager.set_batch(cache_items, instruction)
-                logger.info(f"Cached {cached_count} newly crawled results")
+                    }
+                    for result in processed_results
+                ]
+                # Write back in the background so the response does not wait on Redis
+                self.cache_manager.set_batch_nowait(cache_items, instruction)
+                logger.info(f"Scheduled caching of {len(cache_items)} newly crawled results")
+
+    async def crawl_urls(self, urls: List[str], instruction: str, check_cache: bool = True) -> Dict[str, Any]:
+        """Crawl multiple URLs and process content
+
+        Buffers the output of crawl_urls_stream into a single response.
 
-            # Combine cached and newly crawled results
-            all_processed_results = cached_results + processed_results
+        Args:
+            urls: List of URLs to crawl
+            instruction: Crawling instruction, typically a search query
+            check_cache: Whether to look up URLs in the cache first
+
+        Returns:
+            Dict[str, Any]: Dictionary containing processed content, success count, and failed URLs
+
+        Raises:
+            HTTPException: Raised when all URL crawls fail
+        """
+        try:
+            results = []
+            cache_hits = 0
+            async for result in self.crawl_urls_stream(urls, instruction, check_cache):
+                if result.pop("cached"):
+                    cache_hits += 1
+                results.append(result)
+
+            # Consolidate failed URLs
+            unique_urls = dedupe_urls(urls)
+            crawled_urls = {result["reference"] for result in results}
+            failed_urls = [url for url in unique_urls if url not in crawled_urls]
+            newly_crawled = len(results) - cache_hits
+
+            if not newly_crawled and cache_hits < len(unique_urls):
+                logger.error("All URL crawls failed")
+                raise HTTPException(status_code=500, detail="All URL crawls failed")
 
             response = {
-                "results": all_processed_results,
-                "success_count": len(all_processed_results),
+                "results": results,
+                "success_count": len(results),
                 "failed_urls": failed_urls,
-                "cache_hits": len(cached_results),
-                "newly_crawled": len(processed_results)
+                "cache_hits": cache_hits,
+                "newly_crawled": newly_crawled
             }
 
-            logger.info(f"Crawl completed, total: {len(all_processed_results)}, cache hits: {len(cached_results)}, newly crawled: {len(processed_results)}, failed: {len(failed_urls)}")
+            logger.info(f"Crawl completed, total: {len(results)}, cache hits: {cache_hits}, newly crawled: {newly_crawled}, failed: {len(failed_urls)}")
             return response
         except Exception as e:
             logger.error(f"Exception occurred during crawling: {str(e)}")
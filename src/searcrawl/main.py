@@ -9,14 +9,21 @@ This project can serve as an open-source alternative to Tavily, providing simila
 and web content extraction capabilities.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from contextlib import asynccontextmanager
+from pathlib import Path
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 import uvicorn
+import os
 import sys
 import subprocess
 import asyncio
+import functools
+import time
+import orjson
+from collections import Counter
 from loguru import logger
 
 # Import custom modules
@@ -24,21 +31,81 @@ from searcrawl.config import (
     API_HOST,
     API_PORT,
     DEFAULT_SEARCH_LIMIT,
+    MAX_SEARCH_LIMIT,
     DISABLED_ENGINES,
     ENABLED_ENGINES,
     CRAWLER_POOL_SIZE,
+    CRAWLER_SLOTS,
+    MIN_CRAWLERS,
+    CRAWLER_IDLE_TIMEOUT,
+    POOL_WAIT_TIMEOUT_S,
+    MAX_INFLIGHT_SEARCHES,
     CACHE_ENABLED,
     REDIS_URL,
-    CACHE_TTL_HOURS
+    CACHE_TTL_HOURS,
+    READER_ENABLED
 )
-from searcrawl.crawler import WebCrawler
-from searcrawl.cache import CacheManager
+from searcrawl.crawler import WebCrawler, close_searxng_client, dedupe_urls, is_crawlable_url
+from searcrawl.cache import CacheManager, search_cache_signature
+from searcrawl.reader import get_session as get_reader_session, close_session as close_reader_session
 import searcrawl.logger as log_module
 
 # Global crawler pool and cache manager
 crawler_pool: Optional[asyncio.Queue] = None
 cache_manager = None
 
+# Lazy pool growth: crawlers launched so far, the lock serializing launches,
+# when each crawler last had a slot returned, and the idle reaper task
+crawler_count = 0
+crawler_growth_lock: Optional[asyncio.Lock] = None
+crawler_last_used: Dict[WebCrawler, float] = {}
+crawler_reaper: Optional[asyncio.Task] = None
+
+# In-flight /search pipelines keyed by search signature, joined by identical requests
+_inflight_searches: Dict[str, asyncio.Task] = {}
+
+# Graceful shutdown state: crawler slots currently checked out, set when they
+# have all been returned, and whether new checkouts are being refused
+inflight_crawls = 0
+crawls_drained: Optional[asyncio.Event] = None
+shutting_down = False
+
+# Seconds shutdown waits for in-flight crawls before closing crawlers anyway
+SHUTDOWN_DRAIN_TIMEOUT = 30.0
+
+# Seconds between idle crawler checks
+CRAWLER_REAP_INTERVAL = 60.0
+
+# Crawled results buffered per streaming response while waiting for the client
+STREAM_QUEUE_SIZE = 32
+
+# Playwright browser cache; PLAYWRIGHT_BROWSERS_PATH overrides it, as it does for Playwright
+# itself. The Dockerfile installs Chromium there at image build time.
+PLAYWRIGHT_CACHE_DIR = Path(
+    os.environ.get("PLAYWRIGHT_BROWSERS_PATH") or Path.home() / ".cache" / "ms-playwright"
+)
+
+# Chromium executables inside a chromium-* build directory, per platform
+CHROMIUM_EXECUTABLES = (
+    "chromium-*/chrome-linux/chrome",
+    "chromium-*/chrome-mac/Chromium.app",
+    "chromium-*/chrome-win/chrome.exe",
+)
+
+
+def chromium_installed() -> bool:
+    """Check whether a Playwright Chromium build is already present
+
+    Looks for the browser executable rather than the build directory, so an
+    interrupted download does not count as installed.
+
+    Returns:
+        bool: True if a Chromium executable exists in the browser cache
+    """
+    return any(
+        any(PLAYWRIGHT_CACHE_DIR.glob(pattern)) for pattern in CHROMIUM_EXECUTABLES
+    )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -47,7 +114,8 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown events for the FastAPI application
     """
-    global crawler_pool, cache_manager
+    global crawler_pool, cache_manager, crawls_drained, shutting_down
+    global crawler_count, crawler_growth_lock, crawler_reaper
 
     # Startup
     log_module.setup_logger("INFO")
@@ -58,10 +126,9 @@ async def lifespan(app: FastAPI):
         try:
             logger.info(f"Initializing cache manager with Redis: {REDIS_URL}")
             cache_manager = CacheManager(REDIS_URL, CACHE_TTL_HOURS)
-            if cache_manager.is_available():
+            if await cache_manager.is_available():
+                # Stats need a full keyspace SCAN, so they are left to /cache/stats
                 logger.info("Cache manager initialized successfully")
-                cache_stats = cache_manager.get_cache_stats()
-                logger.info(f"Cache stats: {cache_stats}")
             else:
                 logger.warning("Cache manager initialized but Redis is not available")
                 cache_manager = None
@@ -75,28 +142,58 @@ async def lifespan(app: FastAPI):
 
     # Check and install browsers
     logger.info("Checking Playwright browsers...")
-    try:
-        subprocess.run(
-            [sys.executable, "-m", "playwright", "install", "chromium"],
-            check=True
-        )
-        logger.info("Playwright browsers installed successfully or already exist")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Browser installation failed: {e}")
-        raise
-
-    # Initialize crawler pool
-    logger.info(f"Initializing crawler pool with size: {CRAWLER_POOL_SIZE}")
-    crawler_pool = asyncio.Queue(maxsize=CRAWLER_POOL_SIZE)
+    if chromium_installed():
+        logger.info("Playwright browsers already exist, skipping installation")
+    else:
+        try:
+            # Run the installer in a worker thread so the event loop is not blocked
+            await asyncio.to_thread(
+                subprocess.run,
+                [sys.executable, "-m", "playwright", "install", "chromium"],
+                check=True
+            )
+            logger.info("Playwright browsers installed successfully")
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Browser installation failed: {e}")
+            raise
+
+    shutting_down = False
+    crawls_drained = asyncio.Event()
+    crawls_drained.set()
+
+    # Initialize crawler pool; each queue entry is a slot on a shared crawler,
+    # so the queue bounds concurrent crawls like a semaphore
+    logger.info(
+        f"Initializing crawler pool with {MIN_CRAWLERS} of up to {CRAWLER_POOL_SIZE} crawlers, "
+        f"slots per crawler: {CRAWLER_SLOTS}"
+    )
+    # LIFO so the most recently used, warmest browser is handed out first and
+    # idle ones stay untouched under light load
+    crawler_pool = asyncio.LifoQueue(maxsize=CRAWLER_POOL_SIZE * CRAWLER_SLOTS)
     
-    # Create and initialize crawler instances with cache manager
-    for i in range(CRAWLER_POOL_SIZE):
-        crawler = WebCrawler(cache_manager=cache_manager)
-        await crawler.initialize()
-        await crawler_pool.put(crawler)
-        logger.info(f"Crawler {i+1}/{CRAWLER_POOL_SIZE} initialized and added to pool")
+    crawler_growth_lock = asyncio.Lock()
+    crawler_last_used.clear()
+
+    # Launch only the minimum up front; more are started when every slot is taken
+    crawlers = [WebCrawler(cache_manager=cache_manager) for _ in range(MIN_CRAWLERS)]
+    await asyncio.gather(*(crawler.initialize() for crawler in crawlers))
+    for crawler in crawlers:
+        # One browser multiplexes many pages, so offer it once per slot
+        for _ in range(CRAWLER_SLOTS):
+            crawler_pool.put_nowait(crawler)
+        crawler_last_used[crawler] = time.monotonic()
+    crawler_count = len(crawlers)
+    logger.info(f"{crawler_count} crawlers initialized and added to pool")
+
+    if CRAWLER_POOL_SIZE > MIN_CRAWLERS:
+        crawler_reaper = asyncio.create_task(reap_idle_crawlers())
     
     logger.info("Crawler pool initialization completed")
+
+    # Open the shared Reader session up front so the first fetch skips connector setup
+    if READER_ENABLED:
+        get_reader_session()
+        logger.info("Reader HTTP session initialized")
     logger.info(f"API service running at: http://{API_HOST}:{API_PORT}")
     logger.info("Sear-Crawl4AI service startup completed")
 
@@ -104,20 +201,42 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Starting graceful shutdown...")
+    # Refuse new crawls, then let the ones already running finish
+    shutting_down = True
+    if inflight_crawls:
+        logger.info(f"Waiting for {inflight_crawls} in-flight crawls to finish...")
+        try:
+            await asyncio.wait_for(crawls_drained.wait(), timeout=SHUTDOWN_DRAIN_TIMEOUT)
+        except (asyncio.TimeoutError, TimeoutError):
+            logger.warning(f"{inflight_crawls} crawls still running after {SHUTDOWN_DRAIN_TIMEOUT}s, forcing shutdown")
+
+    if crawler_reaper:
+        crawler_reaper.cancel()
+        crawler_reaper = None
+
     if crawler_pool:
         # Close all crawler instances in the pool
+        # Nothing puts into the pool anymore, so drain it without waiting
         crawlers_to_close = []
-        while not crawler_pool.empty():
+        while True:
             try:
-                crawler = await asyncio.wait_for(crawler_pool.get(), timeout=1.0)
-                crawlers_to_close.append(crawler)
-            except asyncio.TimeoutError:
+                crawlers_to_close.append(crawler_pool.get_nowait())
+            except asyncio.QueueEmpty:
                 break
         
+        # A crawler occupies several slots; close each instance only once
+        crawlers_to_close = list(dict.fromkeys(crawlers_to_close))
+
         # Close all crawlers concurrently
         if crawlers_to_close:
             await asyncio.gather(*[crawler.close() for crawler in crawlers_to_close])
             logger.info(f"Released {len(crawlers_to_close)} crawler instances")
+
+    await close_searxng_client()
+    await close_reader_session()
+
+    if cache_manager:
+        await cache_manager.close()
     
     logger.info("Sear-Crawl4AI service shut down")
 
@@ -128,22 +247,76 @@ app = FastAPI(
     description="An open-source search and crawling tool based on SearXNG and Crawl4AI, "
                 "serving as an open-source alternative to Tavily",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Responses carry whole page texts; orjson encodes them much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 
+# Shared request model settings: immutable, unknown fields dropped, bounded strings
+REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", str_max_length=8192)
+
+
+class ConcurrencyLimitMiddleware:
+    """ASGI middleware rejecting search requests beyond a concurrency limit
+
+    Requests over the limit get HTTP 429 with Retry-After immediately instead
+    of queueing for a crawler slot. A request counts until its response has
+    been fully sent, so open NDJSON streams are included.
+    """
+
+    def __init__(self, app, max_inflight: int, paths: tuple = ("/search", "/search/stream")):
+        """Initialize the middleware
+
+        Args:
+            app: The ASGI application to wrap
+            max_inflight: Maximum number of concurrent limited requests
+            paths: Request paths the limit applies to
+        """
+        self.app = app
+        self.max_inflight = max_inflight
+        self.paths = paths
+        self.inflight = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self.inflight >= self.max_inflight:
+            logger.warning("Rejecting {} request, {} already in flight", scope["path"], self.inflight)
+            response = ORJSONResponse(
+                {"detail": "Too many concurrent requests"},
+                status_code=429,
+                headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        self.inflight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.inflight -= 1
+
+
+app.add_middleware(ConcurrencyLimitMiddleware, max_inflight=MAX_INFLIGHT_SEARCHES)
+
+
 # Request model definitions
 class SearchRequest(BaseModel):
     """Search request model
 
     Attributes:
         query: Search query string
-        limit: Limit on number of results to return, default is 10
+        limit: Limit on number of results to return, default is 10, at most MAX_SEARCH_LIMIT
         disabled_engines: List of disabled search engines, comma-separated
         enabled_engines: List of enabled search engines, comma-separated
     """
+    model_config = REQUEST_MODEL_CONFIG
+
     query: str
-    limit: int = DEFAULT_SEARCH_LIMIT
+    limit: int = Field(default=DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT)
     disabled_engines: str = DISABLED_ENGINES
     enabled_engines: str = ENABLED_ENGINES
 
@@ -156,59 +329,213 @@ class CrawlRequest(BaseModel):
         urls: List of URLs to crawl
         instruction: Crawling instruction, typically a search query
     """
+    model_config = REQUEST_MODEL_CONFIG
+
     urls: List[str]
     instruction: str
 
 
 async def get_crawler_from_pool():
-    """Get a crawler instance from the pool
+    """Get a crawler slot from the pool
+
+    Crawlers are shared: the same instance may serve up to CRAWLER_SLOTS
+    requests at once, each holding one of its slots.
     
     Returns:
-        WebCrawler: A crawler instance from the pool
+        WebCrawler: The crawler owning the acquired slot
         
     Raises:
         HTTPException: If unable to get a crawler from the pool
     """
-    global crawler_pool
+    global crawler_pool, inflight_crawls
     if crawler_pool is None:
         logger.error("Crawler pool not initialized")
         raise HTTPException(status_code=503, detail="Service not ready - crawler pool not initialized")
+
+    if shutting_down:
+        logger.warning("Rejecting crawl request during shutdown")
+        raise HTTPException(status_code=503, detail="Service shutting down")
     
     try:
-        # Wait up to 30 seconds to get a crawler from the pool
-        crawler = await asyncio.wait_for(crawler_pool.get(), timeout=30.0)
+        try:
+            crawler = crawler_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            # Every slot is taken: launch another crawler if the pool may
+            # still grow, otherwise wait for a slot to come back. Both waits
+            # share one POOL_WAIT_TIMEOUT_S deadline.
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + POOL_WAIT_TIMEOUT_S
+            crawler = await grow_crawler_pool(POOL_WAIT_TIMEOUT_S)
+            if crawler is None:
+                crawler = await _pool_get(crawler_pool, max(deadline - loop.time(), 0.0))
+        if shutting_down:
+            # Shutdown started while this request waited; the lifespan is about
+            # to close the crawlers, so hand the slot back instead of using it
+            crawler_pool.put_nowait(crawler)
+            logger.warning("Rejecting crawl request during shutdown")
+            raise HTTPException(status_code=503, detail="Service shutting down")
+        inflight_crawls += 1
+        if crawls_drained:
+            crawls_drained.clear()
         return crawler
-    except asyncio.TimeoutError:
-        logger.error("Timeout waiting for available crawler from pool")
-        raise HTTPException(status_code=503, detail="Service temporarily unavailable - all crawlers busy")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting crawler from pool: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+async def _pool_get(pool: asyncio.Queue, timeout: float) -> WebCrawler:
+    """Wait for a crawler slot, giving up with a 503 after timeout seconds
+
+    Args:
+        pool: Crawler pool to take the slot from
+        timeout: Seconds left of the POOL_WAIT_TIMEOUT_S deadline
+
+    Returns:
+        WebCrawler: The crawler owning the acquired slot
+
+    Raises:
+        HTTPException: 503 if no slot is returned in time
+    """
+    try:
+        return await asyncio.wait_for(pool.get(), timeout=timeout)
+    except (asyncio.TimeoutError, TimeoutError):
+        # Distinct classes before Python 3.11, aliases from then on
+        logger.error("Timeout waiting for available crawler from pool")
+        raise HTTPException(status_code=503, detail="Service temporarily unavailable - all crawlers busy")
+
+
+async def grow_crawler_pool(timeout: float) -> Optional[WebCrawler]:
+    """Launch one more crawler when all slots are taken
+
+    The new crawler's remaining slots are added to the pool and one slot is
+    handed to the caller.
+
+    Args:
+        timeout: Seconds to wait for another request's launch to finish
+
+    Returns:
+        Optional[WebCrawler]: The new crawler, or None if a slot is free again
+            or the pool already holds CRAWLER_POOL_SIZE crawlers
+
+    Raises:
+        HTTPException: 503 if another launch is still running after timeout
+            seconds, or if shutdown starts before a crawler is launched
+    """
+    global crawler_count
+    if crawler_count >= CRAWLER_POOL_SIZE:
+        return None
+
+    try:
+        await asyncio.wait_for(crawler_growth_lock.acquire(), timeout=timeout)
+    except (asyncio.TimeoutError, TimeoutError):
+        logger.error("Timeout waiting for another crawler to launch")
+        raise HTTPException(status_code=503, detail="Service temporarily unavailable - all crawlers busy")
+
+    try:
+        if shutting_down:
+            raise HTTPException(status_code=503, detail="Service shutting down")
+        # Another request may have grown the pool while this one waited
+        if not crawler_pool.empty() or crawler_count >= CRAWLER_POOL_SIZE:
+            return None
+
+        crawler = WebCrawler(cache_manager=cache_manager)
+        await crawler.initialize()
+        if shutting_down:
+            # The lifespan may already have drained the pool, so it would never
+            # see this crawler; close it here instead
+            await crawler.close()
+            raise HTTPException(status_code=503, detail="Service shutting down")
+        crawler_count += 1
+        crawler_last_used[crawler] = time.monotonic()
+        for _ in range(CRAWLER_SLOTS - 1):
+            crawler_pool.put_nowait(crawler)
+        logger.info(f"Crawler pool grown to {crawler_count} crawlers")
+        return crawler
+    finally:
+        crawler_growth_lock.release()
+
+
+def shrink_crawler_pool() -> List[WebCrawler]:
+    """Take idle crawlers beyond MIN_CRAWLERS out of the pool
+
+    A crawler is idle when all of its slots are in the pool and none has been
+    returned for CRAWLER_IDLE_TIMEOUT seconds. The pool is drained and refilled
+    without awaiting, so no request can take a slot in between.
+
+    Returns:
+        List[WebCrawler]: Crawlers removed from the pool, to be closed by the caller
+    """
+    global crawler_count
+    if crawler_pool is None or crawler_count <= MIN_CRAWLERS:
+        return []
+
+    slots = []
+    while True:
+        try:
+            slots.append(crawler_pool.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+
+    now = time.monotonic()
+    idle = [
+        crawler for crawler, free in Counter(slots).items()
+        if free == CRAWLER_SLOTS and now - crawler_last_used.get(crawler, now) > CRAWLER_IDLE_TIMEOUT
+    ]
+    # Close the least recently used ones first
+    idle.sort(key=lambda crawler: crawler_last_used.get(crawler, now))
+    removed = idle[:crawler_count - MIN_CRAWLERS]
+
+    # Refill bottom-up so the LIFO order is unchanged for the crawlers kept
+    for crawler in reversed(slots):
+        if crawler not in removed:
+            crawler_pool.put_nowait(crawler)
+    for crawler in removed:
+        crawler_last_used.pop(crawler, None)
+    crawler_count -= len(removed)
+    return removed
+
+
+async def reap_idle_crawlers():
+    """Periodically close idle crawlers until the pool is back to MIN_CRAWLERS"""
+    while True:
+        await asyncio.sleep(CRAWLER_REAP_INTERVAL)
+        removed = shrink_crawler_pool()
+        if removed:
+            await asyncio.gather(*(crawler.close() for crawler in removed), return_exceptions=True)
+            logger.info(f"Closed {len(removed)} idle crawlers, {crawler_count} remaining")
+
+
 async def return_crawler_to_pool(crawler: WebCrawler):
-    """Return a crawler instance to the pool
+    """Return a crawler slot to the pool
     
     Args:
-        crawler: The crawler instance to return to the pool
+        crawler: The crawler whose slot is being released
     """
-    global crawler_pool
+    global crawler_pool, inflight_crawls
     if crawler_pool is None:
         logger.error("Crawler pool not initialized, cannot return crawler")
         return
     
     try:
+        crawler_last_used[crawler] = time.monotonic()
         await crawler_pool.put(crawler)
     except Exception as e:
         logger.error(f"Error returning crawler to pool: {str(e)}")
+    finally:
+        inflight_crawls -= 1
+        if not inflight_crawls and crawls_drained:
+            crawls_drained.set()
 
 
-async def crawl(request: CrawlRequest):
+async def crawl(request: CrawlRequest, check_cache: bool = True):
     """
     API endpoint function to crawl multiple URLs and process content
 
     Args:
         request: Crawl request containing URLs and instruction
+        check_cache: Whether the crawler should look up URLs in the cache first
 
     Returns:
         Dict: Dictionary containing processed content, success count, and failed URLs
@@ -218,7 +545,7 @@ async def crawl(request: CrawlRequest):
     """
     crawler = await get_crawler_from_pool()
     try:
-        return await crawler.crawl_urls(request.urls, request.instruction)
+        return await crawler.crawl_urls(request.urls, request.instruction, check_cache)
     finally:
         await return_crawler_to_pool(crawler)
 
@@ -239,8 +566,8 @@ async def get_cache_stats():
             logger.warning("Cache manager not available")
             return {"status": "unavailable", "message": "Cache is not enabled or not available"}
         
-        stats = cache_manager.get_cache_stats()
-        logger.info(f"Cache stats retrieved: {stats}")
+        stats = await cache_manager.get_cache_stats()
+        logger.opt(lazy=True).debug("Cache stats retrieved: {}", lambda: stats)
         return stats
     except Exception as e:
         logger.error(f"Error getting cache stats: {str(e)}")
@@ -263,7 +590,7 @@ async def clear_cache():
             logger.warning("Cache manager not available")
             return {"status": "unavailable", "message": "Cache is not enabled or not available"}
         
-        success = cache_manager.clear_all()
+        success = await cache_manager.clear_all()
         if success:
             logger.info("Cache cleared successfully")
             return {"status": "success", "message": "Cache cleared successfully"}
@@ -275,6 +602,121 @@ async def clear_cache():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def search_urls(request: SearchRequest) -> List[str]:
+    """Query SearXNG and extract the distinct result URLs to crawl
+
+    Args:
+        request: Search request object containing query string and configuration parameters
+
+    Returns:
+        List[str]: Up to request.limit distinct result URLs
+
+    Raises:
+        HTTPException: Raised when SearXNG returns no usable results
+    """
+    # Call SearXNG search engine (now async)
+    response = await WebCrawler.make_searxng_request(
+        query=request.query,
+        limit=request.limit,
+        disabled_engines=request.disabled_engines,
+        enabled_engines=request.enabled_engines
+    )
+
+    # Check search results
+    results = response.get("results", [])
+    if not results:
+        logger.warning("No search results found")
+        raise HTTPException(status_code=404, detail="No search results found")
+
+    # Limit result count and extract URLs, skipping non-http(s) and IP-literal links
+    # The same page is often returned by several engines, so drop duplicates
+    # before applying the limit to keep up to `limit` distinct pages
+    urls = dedupe_urls([
+        result["url"] for result in results
+        if "url" in result and is_crawlable_url(result["url"])
+    ])[:request.limit]
+    if not urls:
+        logger.warning("No valid URLs found")
+        raise HTTPException(status_code=404, detail="No valid URLs found")
+    return urls
+
+
+async def run_search(request: SearchRequest) -> Dict[str, Any]:
+    """Run the SearXNG query and crawl for a search, then cache the result
+
+    Args:
+        request: Search request object containing query string and configuration parameters
+
+    Returns:
+        Dict: Dictionary containing processed content, success count, and failed URLs
+
+    Raises:
+        HTTPException: Raised when an error occurs during search or crawling
+    """
+    # Query SearXNG for the pages to crawl
+    urls = await search_urls(request)
+    logger.info("Found {} URLs, starting to crawl", len(urls))
+
+    # Resolve cached pages with one MGET so they never wait for a crawler slot
+    cached_results = []
+    urls_to_crawl = urls
+    if cache_manager:
+        cache_hits = await cache_manager.get_batch(urls, request.query)
+        cached_results = [
+            {"content": cache_hits[url].get("content"), "reference": cache_hits[url].get("reference")}
+            for url in urls if cache_hits.get(url)
+        ]
+        urls_to_crawl = [url for url in urls if not cache_hits.get(url)]
+        logger.info("Cache hits: {}, URLs to crawl: {}", len(cached_results), len(urls_to_crawl))
+
+    # Call crawl function to process the remaining URLs
+    if urls_to_crawl:
+        crawl_result = await crawl(
+            CrawlRequest(urls=urls_to_crawl, instruction=request.query), check_cache=False
+        )
+    else:
+        crawl_result = {"results": [], "success_count": 0, "failed_urls": [], "cache_hits": 0, "newly_crawled": 0}
+
+    results = cached_results + crawl_result["results"]
+    crawl_result = {
+        **crawl_result,
+        "results": results,
+        "success_count": len(results),
+        "cache_hits": len(cached_results),
+    }
+
+    # Cache the search result
+    if cache_manager:
+        await cache_manager.set_search_cache(
+            request.query,
+            crawl_result,
+            limit=request.limit,
+            disabled_engines=request.disabled_engines,
+            enabled_engines=request.enabled_engines
+        )
+
+    return crawl_result
+
+
+def _finish_inflight_search(key: str, task: asyncio.Task) -> None:
+    """Forget a finished shared search and retrieve its outcome
+
+    Every client awaiting the shielded task may already have disconnected, so
+    the exception is retrieved here to keep asyncio from reporting it as
+    never retrieved.
+
+    Args:
+        key: Search signature the task was registered under
+        task: The finished search task
+    """
+    _inflight_searches.pop(key, None)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning("In-flight search {} failed: {!r}", key, exc)
+
+
 @app.post("/search")
 async def search(request: SearchRequest):
     """
@@ -295,53 +737,133 @@ async def search(request: SearchRequest):
     global cache_manager
     try:
         # Add status feedback
-        logger.info(f"Starting search: {request.query}")
+        logger.info("Starting search: {}", request.query)
 
         # Check cache for search results
         if cache_manager:
-            cached_result = cache_manager.get_search_cache(request.query)
+            cached_result = await cache_manager.get_search_cache(
+                request.query,
+                limit=request.limit,
+                disabled_engines=request.disabled_engines,
+                enabled_engines=request.enabled_engines
+            )
             if cached_result:
-                logger.info(f"Search cache hit for query: {request.query}")
+                logger.info("Search cache hit for query: {}", request.query)
                 return cached_result
 
-        # Call SearXNG search engine (now async)
-        response = await WebCrawler.make_searxng_request(
-            query=request.query,
-            limit=request.limit,
-            disabled_engines=request.disabled_engines,
-            enabled_engines=request.enabled_engines
+        # Identical concurrent searches share one SearXNG call and crawl
+        key = search_cache_signature(
+            request.query, request.limit, request.disabled_engines, request.enabled_engines
         )
+        task = _inflight_searches.get(key)
+        if task is None:
+            task = asyncio.create_task(run_search(request))
+            _inflight_searches[key] = task
+            task.add_done_callback(functools.partial(_finish_inflight_search, key))
+        else:
+            logger.info("Joining in-flight search for query: {}", request.query)
 
-        # Check search results
-        results = response.get("results", [])
-        if not results:
-            logger.warning("No search results found")
-            raise HTTPException(status_code=404, detail="No search results found")
+        # Shielded so one client disconnecting does not cancel the others' result
+        return await asyncio.shield(task)
+    except HTTPException:
+        # Directly re-raise HTTP exceptions
+        raise
+    except Exception as e:
+        # Log other exceptions and convert to HTTP exception
+        logger.error(f"Exception occurred during search: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Limit result count and extract URLs
-        urls = [result["url"] for result in results[:request.limit] if "url" in result]
-        if not urls:
-            logger.warning("No valid URLs found")
-            raise HTTPException(status_code=404, detail="No valid URLs found")
 
-        logger.info(f"Found {len(urls)} URLs, starting to crawl")
+class CrawlerStreamingResponse(StreamingResponse):
+    """StreamingResponse that holds a crawler slot for as long as it streams
 
-        # Call crawl function to process URLs
-        crawl_result = await crawl(CrawlRequest(urls=urls, instruction=request.query))
+    The slot is returned however the response ends, including when sending
+    the response start fails or the client leaves before the body iterator
+    has been started.
+    """
+
+    def __init__(self, content, crawler: WebCrawler, **kwargs):
+        """Initialize the response
+
+        Args:
+            content: Async iterator producing the response body
+            crawler: Crawler whose slot is released once the response is done
+            **kwargs: Passed on to StreamingResponse
+        """
+        super().__init__(content, **kwargs)
+        self.crawler = crawler
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                # Run the body's own cleanup now rather than whenever it is collected
+                await self.body_iterator.aclose()
+            finally:
+                await return_crawler_to_pool(self.crawler)
 
-        # Cache the search result
-        if cache_manager:
-            cache_manager.set_search_cache(request.query, crawl_result)
 
-        return crawl_result
+@app.post("/search/stream")
+async def search_stream(request: SearchRequest):
+    """
+    Streaming search API endpoint
+
+    Same as /search, but responds with newline-delimited JSON: one line per
+    page, written as soon as that page has been fetched and converted.
+    Each line holds 'content', 'reference' and 'cached'. Whole responses are
+    not stored in the search cache; per-URL crawl caching still applies.
+
+    Args:
+        request: Search request object containing query string and configuration parameters
+
+    Returns:
+        StreamingResponse: NDJSON stream of crawled results
+
+    Raises:
+        HTTPException: Raised when an error occurs before streaming starts
+    """
+    try:
+        logger.info("Starting streaming search: {}", request.query)
+        urls = await search_urls(request)
     except HTTPException:
-        # Directly re-raise HTTP exceptions
         raise
     except Exception as e:
-        # Log other exceptions and convert to HTTP exception
         logger.error(f"Exception occurred during search: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    logger.info("Found {} URLs, starting to stream crawl results", len(urls))
+    crawler = await get_crawler_from_pool()
+
+    # Bounded buffer between the crawl and the client: crawling runs ahead of a
+    # slow reader by at most STREAM_QUEUE_SIZE results, then waits for it
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+    async def produce():
+        stream = crawler.crawl_urls_stream(urls, request.query)
+        try:
+            async for result in stream:
+                await queue.put(result)
+        except Exception as e:
+            # Headers are already sent, so the stream just ends early
+            logger.error(f"Exception occurred during streaming crawl: {str(e)}")
+        finally:
+            # Close explicitly so cache write-back runs even when cancelled
+            await stream.aclose()
+        await queue.put(None)
+
+    async def generate():
+        producer = asyncio.create_task(produce())
+        try:
+            while (result := await queue.get()) is not None:
+                yield orjson.dumps(result) + b"\n"
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    # The crawler stays checked out until the response ends or the client leaves
+    return CrawlerStreamingResponse(generate(), crawler=crawler, media_type="application/x-ndjson")
+
 
 def main():
     """Main entry point for the application"""
@@ -1,10 +1,54 @@
 import asyncio
 import aiohttp
+from types import MappingProxyType
 from aiohttp import ClientTimeout
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
 from .config import READER_URL, READER_API_KEY
 from .logger import logger
 
+# Per-request Reader headers, built once since the API key never changes at runtime;
+# Accept and X-Respond-With are set on the shared session instead
+_AUTH_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"Authorization": f"Bearer {READER_API_KEY}"} if READER_API_KEY else {}
+)
+
+# Shared session reused across Reader requests for connection and DNS reuse
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Gets or lazily creates the shared Reader HTTP session.
+
+    Must be called from within the running event loop.
+
+    Returns:
+        aiohttp.ClientSession: Connection-pooled session kept alive between fetches.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=200, limit_per_host=32, ttl_dns_cache=300),
+            timeout=ClientTimeout(total=30),
+            headers={
+                "Accept": "application/json",
+                "X-Respond-With": "markdown",
+            },
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """
+    Closes the shared Reader HTTP session and releases its connections.
+    """
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.info("Reader HTTP session closed")
+
+
 async def fetch_with_reader(url: str) -> Optional[Dict[str, Any]]:
     """
     Asynchronously fetches the content of a URL using the Jina Reader service.
@@ -17,30 +61,24 @@ async def fetch_with_reader(url: str) -> Optional[Dict[str, Any]]:
                                      or None if the fetch failed.
     """
     reader_api_url = f"{READER_URL}/{url}"
-    headers = {
-        "Accept": "application/json",
-        "X-Respond-With": "markdown",
-    }
-    if READER_API_KEY:
-        headers["Authorization"] = f"Bearer {READER_API_KEY}"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(reader_api_url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    if content:
-                        logger.info(f"Successfully fetched content for {url} with Jina Reader.")
-                        return {"content": content, "reference": url}
-                    else:
-                        logger.warning(f"Jina Reader returned no content for {url}.")
-                        return None
+        session = get_session()
+        async with session.get(reader_api_url, headers=_AUTH_HEADERS) as response:
+            if response.status == 200:
+                content = await response.text()
+                if content:
+                    logger.info(f"Successfully fetched content for {url} with Jina Reader.")
+                    return {"content": content, "reference": url}
                 else:
-                    error_text = await response.text()
-                    logger.error(
-                        f"Failed to fetch {url} with Jina Reader. Status: {response.status}, Response: {error_text}"
-                    )
+                    logger.warning(f"Jina Reader returned no content for {url}.")
                     return None
+            else:
+                error_text = await response.text()
+                logger.error(
+                    f"Failed to fetch {url} with Jina Reader. Status: {response.status}, Response: {error_text}"
+                )
+                return None
     except asyncio.TimeoutError:
         logger.error(f"Timeout error when fetching {url} with Jina Reader.")
         return None
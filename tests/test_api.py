@@ -3,9 +3,18 @@
 Tests for API endpoints
 """
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
 import pytest
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
-from searcrawl.main import app
+from loguru import logger
+from starlette.requests import ClientDisconnect
+
+import searcrawl.main as main_module
+from searcrawl.main import ConcurrencyLimitMiddleware, app
 
 
 @pytest.fixture
@@ -14,6 +23,20 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def pool(monkeypatch):
+    """Install an empty crawler pool at full size, with no crawl in flight"""
+    crawler_pool = asyncio.LifoQueue()
+    monkeypatch.setattr(main_module, "crawler_pool", crawler_pool)
+    monkeypatch.setattr(main_module, "crawler_growth_lock", asyncio.Lock())
+    monkeypatch.setattr(main_module, "crawler_count", main_module.CRAWLER_POOL_SIZE)
+    monkeypatch.setattr(main_module, "crawler_last_used", {})
+    monkeypatch.setattr(main_module, "crawls_drained", asyncio.Event())
+    monkeypatch.setattr(main_module, "inflight_crawls", 0)
+    monkeypatch.setattr(main_module, "shutting_down", False)
+    return crawler_pool
+
+
 def test_search_endpoint_structure(client):
     """Test that search endpoint exists and returns proper structure"""
     # Note: This will fail without actual SearXNG running
@@ -32,6 +55,14 @@ def test_search_request_validation(client):
     response = client.post("/search", json={})
     assert response.status_code == 422  # Validation error
 
+    # Test with an oversized query
+    response = client.post("/search", json={"query": "x" * 8193})
+    assert response.status_code == 422
+
+    # Test with out-of-range limits
+    assert client.post("/search", json={"query": "test", "limit": 0}).status_code == 422
+    assert client.post("/search", json={"query": "test", "limit": 100000}).status_code == 422
+
 
 def test_api_docs_accessible(client):
     """Test that API documentation is accessible"""
@@ -39,4 +70,303 @@ def test_api_docs_accessible(client):
     assert response.status_code == 200
     
     response = client.get("/openapi.json")
-    assert response.status_code == 200
\ No newline at end of file
+    assert response.status_code == 200
+
+
+def test_chromium_installed_detects_browser_cache(tmp_path, monkeypatch):
+    """Test that an existing Chromium build skips the startup install"""
+    monkeypatch.setattr(main_module, "PLAYWRIGHT_CACHE_DIR", tmp_path)
+    assert not main_module.chromium_installed()
+
+    # A build directory without the executable is an interrupted download
+    executable_dir = tmp_path / "chromium-1155" / "chrome-linux"
+    executable_dir.mkdir(parents=True)
+    assert not main_module.chromium_installed()
+
+    (executable_dir / "chrome").touch()
+    assert main_module.chromium_installed()
+
+
+def test_search_awaits_searxng_and_crawls_results(client, monkeypatch):
+    """Test that search awaits the SearXNG call and crawls the returned URLs"""
+    searxng = AsyncMock(return_value={"results": [{"url": "https://a.com"}, {"title": "no url"}]})
+    crawl = AsyncMock(return_value={"results": [], "success_count": 0, "failed_urls": []})
+    monkeypatch.setattr(main_module.WebCrawler, "make_searxng_request", searxng)
+    monkeypatch.setattr(main_module, "crawl", crawl)
+    monkeypatch.setattr(main_module, "cache_manager", None)
+
+    response = client.post("/search", json={"query": "test", "limit": 5})
+
+    assert response.status_code == 200
+    searxng.assert_awaited_once()
+    assert crawl.await_args.args[0].urls == ["https://a.com"]
+
+
+def test_search_stream_returns_ndjson_lines(client, monkeypatch):
+    """Test that streaming search writes one JSON line per crawled page"""
+    class StreamingCrawler:
+        async def crawl_urls_stream(self, urls, instruction):
+            for url in urls:
+                yield {"content": url.upper(), "reference": url, "cached": False}
+
+    searxng = AsyncMock(return_value={"results": [{"url": "https://a.com"}, {"url": "https://b.com"}]})
+    returned = AsyncMock()
+    monkeypatch.setattr(main_module.WebCrawler, "make_searxng_request", searxng)
+    monkeypatch.setattr(main_module, "get_crawler_from_pool", AsyncMock(return_value=StreamingCrawler()))
+    monkeypatch.setattr(main_module, "return_crawler_to_pool", returned)
+
+    response = client.post("/search/stream", json={"query": "test"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [orjson.loads(line) for line in response.content.splitlines()]
+    assert [line["reference"] for line in lines] == ["https://a.com", "https://b.com"]
+    returned.assert_awaited_once()
+
+
+async def test_search_stream_returns_crawler_when_client_leaves_before_start(monkeypatch):
+    """Test that the crawler slot is released even if the body never starts"""
+    crawler = MagicMock()
+    returned = AsyncMock()
+    monkeypatch.setattr(main_module, "search_urls", AsyncMock(return_value=["https://a.com"]))
+    monkeypatch.setattr(main_module, "get_crawler_from_pool", AsyncMock(return_value=crawler))
+    monkeypatch.setattr(main_module, "return_crawler_to_pool", returned)
+
+    response = await main_module.search_stream(main_module.SearchRequest(query="test"))
+
+    async def send(message):
+        raise OSError("client went away")
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await response(scope, receive, send)
+
+    returned.assert_awaited_once_with(crawler)
+    crawler.crawl_urls_stream.assert_not_called()
+
+
+async def test_identical_concurrent_searches_share_one_pipeline(monkeypatch):
+    """Test that a duplicate search joins the one already in flight"""
+    release = asyncio.Event()
+
+    async def slow_search(request):
+        await release.wait()
+        return {"results": [], "success_count": 0, "failed_urls": []}
+
+    run_search = AsyncMock(side_effect=slow_search)
+    monkeypatch.setattr(main_module, "run_search", run_search)
+    monkeypatch.setattr(main_module, "cache_manager", None)
+
+    request = main_module.SearchRequest(query="test")
+    searches = asyncio.gather(main_module.search(request), main_module.search(request))
+    await asyncio.sleep(0)
+    release.set()
+    first, second = await searches
+
+    assert first == second
+    run_search.assert_awaited_once()
+    assert not main_module._inflight_searches
+
+
+async def test_abandoned_search_failure_is_retrieved(monkeypatch):
+    """Test that a shared search failing after all clients left is still logged"""
+    release = asyncio.Event()
+
+    async def failing_search(request):
+        await release.wait()
+        raise RuntimeError("searxng down")
+
+    monkeypatch.setattr(main_module, "run_search", AsyncMock(side_effect=failing_search))
+    monkeypatch.setattr(main_module, "cache_manager", None)
+    messages = []
+    sink = logger.add(messages.append, level="WARNING")
+
+    search = asyncio.create_task(main_module.search(main_module.SearchRequest(query="test")))
+    await asyncio.sleep(0)
+    (task,) = main_module._inflight_searches.values()
+    search.cancel()
+    await asyncio.gather(search, return_exceptions=True)
+
+    release.set()
+    await asyncio.gather(task, return_exceptions=True)
+    logger.remove(sink)
+
+    assert not main_module._inflight_searches
+    assert any("searxng down" in message for message in messages)
+
+
+async def test_pool_tracks_inflight_crawls_and_refuses_during_shutdown(pool, monkeypatch):
+    """Test that checkouts are counted and refused once shutdown starts"""
+    pool.put_nowait("crawler")
+
+    crawler = await main_module.get_crawler_from_pool()
+    assert main_module.inflight_crawls == 1
+    assert not main_module.crawls_drained.is_set()
+
+    monkeypatch.setattr(main_module, "shutting_down", True)
+    with pytest.raises(HTTPException) as exc_info:
+        await main_module.get_crawler_from_pool()
+    assert exc_info.value.status_code == 503
+
+    await main_module.return_crawler_to_pool(crawler)
+    assert main_module.inflight_crawls == 0
+    assert main_module.crawls_drained.is_set()
+
+
+async def test_pool_wait_times_out_with_503(pool, monkeypatch):
+    """Test that waiting too long for a crawler slot is reported as busy"""
+    monkeypatch.setattr(main_module, "POOL_WAIT_TIMEOUT_S", 0.01)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await main_module.get_crawler_from_pool()
+    assert exc_info.value.status_code == 503
+
+
+async def test_waiting_checkout_refused_once_shutdown_starts(pool, monkeypatch):
+    """Test that a slot freed during shutdown goes back instead of to a waiter"""
+    waiter = asyncio.create_task(main_module.get_crawler_from_pool())
+    await asyncio.sleep(0)
+    monkeypatch.setattr(main_module, "shutting_down", True)
+    pool.put_nowait("crawler")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await waiter
+    assert exc_info.value.status_code == 503
+    assert main_module.inflight_crawls == 0
+    assert pool.get_nowait() == "crawler"
+
+
+async def test_pool_does_not_grow_during_shutdown(pool, monkeypatch):
+    """Test that a crawler launched as shutdown starts is closed, not pooled"""
+    launched = MagicMock(close=AsyncMock())
+
+    async def initialize():
+        monkeypatch.setattr(main_module, "shutting_down", True)
+
+    launched.initialize = initialize
+    monkeypatch.setattr(main_module, "WebCrawler", lambda **kwargs: launched)
+    monkeypatch.setattr(main_module, "crawler_count", 0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await main_module.get_crawler_from_pool()
+    assert exc_info.value.status_code == 503
+    launched.close.assert_awaited_once()
+    assert main_module.crawler_count == 0
+    assert pool.empty()
+
+
+async def test_pool_wait_covers_crawler_launch_in_progress(pool, monkeypatch):
+    """Test that waiting behind another crawler launch also times out with 503"""
+    await main_module.crawler_growth_lock.acquire()
+    monkeypatch.setattr(main_module, "crawler_count", 0)
+    monkeypatch.setattr(main_module, "POOL_WAIT_TIMEOUT_S", 0.01)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await main_module.get_crawler_from_pool()
+    assert exc_info.value.status_code == 503
+    assert main_module.crawler_growth_lock.locked()
+
+
+async def test_pool_grows_on_demand_and_shrinks_when_idle(pool, monkeypatch):
+    """Test that crawlers are launched when all slots are taken and closed when idle"""
+    launched = []
+
+    def fake_crawler(**kwargs):
+        crawler = MagicMock(initialize=AsyncMock(), close=AsyncMock())
+        launched.append(crawler)
+        return crawler
+
+    warm = MagicMock()
+    pool.put_nowait(warm)
+    monkeypatch.setattr(main_module, "WebCrawler", fake_crawler)
+    monkeypatch.setattr(main_module, "crawler_last_used", {warm: 0.0})
+    monkeypatch.setattr(main_module, "crawler_count", 1)
+    monkeypatch.setattr(main_module, "CRAWLER_POOL_SIZE", 2)
+    monkeypatch.setattr(main_module, "CRAWLER_SLOTS", 1)
+    monkeypatch.setattr(main_module, "MIN_CRAWLERS", 1)
+
+    first = await main_module.get_crawler_from_pool()
+    second = await main_module.get_crawler_from_pool()
+    assert first is warm
+    assert second is launched[0]
+    second.initialize.assert_awaited_once()
+    assert main_module.crawler_count == 2
+
+    await main_module.return_crawler_to_pool(first)
+    await main_module.return_crawler_to_pool(second)
+    monkeypatch.setattr(main_module, "CRAWLER_IDLE_TIMEOUT", -1.0)
+    # The least recently returned crawler goes first; the minimum stays warm
+    assert main_module.shrink_crawler_pool() == [warm]
+    assert main_module.crawler_count == 1
+    assert pool.get_nowait() is second
+
+
+async def test_run_search_skips_crawl_for_cached_urls(monkeypatch):
+    """Test that cached URLs are answered without checking out a crawler"""
+    cache = MagicMock()
+    cache.get_batch = AsyncMock(return_value={
+        "https://a.com": {"content": "A", "reference": "https://a.com"},
+        "https://b.com": None,
+    })
+    cache.set_search_cache = AsyncMock(return_value=True)
+    crawl = AsyncMock(return_value={
+        "results": [{"content": "B", "reference": "https://b.com"}],
+        "success_count": 1, "failed_urls": [], "cache_hits": 0, "newly_crawled": 1,
+    })
+    monkeypatch.setattr(main_module, "cache_manager", cache)
+    monkeypatch.setattr(main_module, "search_urls", AsyncMock(return_value=["https://a.com", "https://b.com"]))
+    monkeypatch.setattr(main_module, "crawl", crawl)
+
+    result = await main_module.run_search(main_module.SearchRequest(query="test"))
+
+    assert crawl.await_args.args[0].urls == ["https://b.com"]
+    assert [r["reference"] for r in result["results"]] == ["https://a.com", "https://b.com"]
+    assert result["success_count"] == 2
+    assert result["cache_hits"] == 1
+
+    # With every URL cached no crawler is needed at all
+    cache.get_batch.return_value = {"https://a.com": {"content": "A", "reference": "https://a.com"}}
+    monkeypatch.setattr(main_module, "search_urls", AsyncMock(return_value=["https://a.com"]))
+    crawl.reset_mock()
+    result = await main_module.run_search(main_module.SearchRequest(query="test"))
+    crawl.assert_not_awaited()
+    assert result["success_count"] == 1
+
+
+def test_concurrency_limit_rejects_search_when_full():
+    """Test that searches over the inflight limit get 429 with Retry-After"""
+    limited = FastAPI()
+
+    @limited.post("/search")
+    async def search():
+        return {"ok": True}
+
+    @limited.get("/cache/stats")
+    async def stats():
+        return {"ok": True}
+
+    limited.add_middleware(ConcurrencyLimitMiddleware, max_inflight=0)
+    limited_client = TestClient(limited)
+
+    response = limited_client.post("/search")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+
+    # Paths outside the limit are unaffected
+    assert limited_client.get("/cache/stats").status_code == 200
+
+
+def test_cache_endpoints_await_async_cache_manager(client, monkeypatch):
+    """Test that cache endpoints await the asyncio Redis-backed manager"""
+    cache = MagicMock()
+    cache.get_cache_stats = AsyncMock(return_value={"status": "available", "total_entries": 3})
+    cache.clear_all = AsyncMock(return_value=True)
+    monkeypatch.setattr(main_module, "cache_manager", cache)
+
+    assert client.get("/cache/stats").json()["total_entries"] == 3
+    assert client.post("/cache/clear").json()["status"] == "success"
+    cache.get_cache_stats.assert_awaited_once()
+    cache.clear_all.assert_awaited_once()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for cache module
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+from searcrawl.cache import CacheManager, search_cache_signature
+
+
+@pytest.fixture
+def cache_manager():
+    """Create a cache manager backed by a mocked Redis client"""
+    manager = CacheManager("redis://localhost:6379/0")
+    manager.redis_client = MagicMock()
+    return manager
+
+
+def test_cache_key_generation(cache_manager):
+    """Test that cache keys are namespaced and deterministic"""
+    key = cache_manager._generate_cache_key("https://example.com", "query")
+
+    assert key.startswith("crawl_cache:")
+    assert key == cache_manager._generate_cache_key("https://example.com", "query")
+    assert key != cache_manager._generate_cache_key("https://example.com", "other")
+    assert cache_manager._generate_search_cache_key("query").startswith("search_cache:")
+
+
+def test_cache_key_separates_url_and_instruction(cache_manager):
+    """Test that the URL/instruction boundary is part of the hashed key"""
+    assert cache_manager._generate_cache_key("https://a.com:8080", "q") != \
+        cache_manager._generate_cache_key("https://a.com", "8080:q")
+    assert cache_manager._generate_cache_key("https://a.com", "\0b") != \
+        cache_manager._generate_cache_key("https://a.com\0", "b")
+
+
+def test_search_cache_signature_fields_cannot_collide():
+    """Test that separators inside user-controlled fields stay unambiguous"""
+    assert search_cache_signature("a|5|", 5, "", "x") != search_cache_signature("a", 5, "|5|", "x")
+    assert search_cache_signature("a|5||") != search_cache_signature("a", 5)
+    assert search_cache_signature('["a", 5, "", ""]') != search_cache_signature("a", 5)
+    assert search_cache_signature("a", 5) == search_cache_signature("a", 5)
+
+
+async def test_get_batch_uses_single_mget(cache_manager):
+    """Test that batch lookups issue one MGET for all URLs"""
+    cached = {"content": "text", "reference": "https://a.com"}
+    cache_manager.redis_client.mget = AsyncMock(return_value=[orjson.dumps(cached), None])
+
+    results = await cache_manager.get_batch(["https://a.com", "https://b.com"], "query")
+
+    assert results == {"https://a.com": cached, "https://b.com": None}
+    cache_manager.redis_client.mget.assert_awaited_once()
+
+
+async def test_set_batch_uses_single_pipeline(cache_manager):
+    """Test that batch writes are flushed in one pipeline execution"""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    cache_manager.redis_client.pipeline.return_value = pipe
+
+    items = [
+        {"url": "https://a.com", "content": "a", "reference": "https://a.com"},
+        {"url": "https://b.com", "content": "b", "reference": "https://b.com"},
+    ]
+    count = await cache_manager.set_batch(items, "query")
+
+    assert count == 2
+    assert pipe.setex.call_count == 2
+    pipe.execute.assert_awaited_once()
+
+
+async def test_cache_unavailable_degrades_gracefully(cache_manager):
+    """Test that batch operations fall back to misses when Redis is missing"""
+    cache_manager.redis_client = None
+
+    assert await cache_manager.get_batch(["https://a.com"]) == {"https://a.com": None}
+    assert await cache_manager.set_batch([{"url": "https://a.com"}]) == 0
+
+
+async def test_set_batch_nowait_runs_in_background(cache_manager):
+    """Test that background writes are tracked until they complete"""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True])
+    cache_manager.redis_client.pipeline.return_value = pipe
+
+    task = cache_manager.set_batch_nowait(
+        [{"url": "https://a.com", "content": "a", "reference": "https://a.com"}], "query"
+    )
+
+    assert task in cache_manager._pending_writes
+    assert await task == 1
+    assert not cache_manager._pending_writes
+
+
+async def test_search_cache_keyed_by_search_parameters(cache_manager):
+    """Test that searches differing in limit or engines use separate keys"""
+    cache_manager.redis_client.mget = AsyncMock(return_value=[None])
+
+    await cache_manager.get_search_cache("query", limit=5, enabled_engines="google__general")
+    await cache_manager.get_search_cache("query", limit=10, enabled_engines="google__general")
+
+    first, second = (call.args[0] for call in cache_manager.redis_client.mget.await_args_list)
+    assert first != second
+
+
+async def test_concurrent_search_lookups_share_one_mget(cache_manager):
+    """Test that search cache lookups in the same window are coalesced"""
+    cached = orjson.dumps({"result": {"results": []}})
+    cache_manager.redis_client.mget = AsyncMock(return_value=[cached, None])
+
+    first, second = await asyncio.gather(
+        cache_manager.get_search_cache("hit", limit=5),
+        cache_manager.get_search_cache("miss", limit=5),
+    )
+
+    assert first == {"results": []}
+    assert second is None
+    cache_manager.redis_client.mget.assert_awaited_once()
+
+
+@pytest.mark.parametrize("started", [True, False])
+async def test_coalescer_recovers_from_cancelled_window(cache_manager, started):
+    """Test that cancelling a pending flush releases callers and resets the batch"""
+    cache_manager.redis_client.mget = AsyncMock(return_value=[None])
+
+    lookup = asyncio.create_task(cache_manager.get_search_cache("query", limit=5))
+    await asyncio.sleep(0)
+    if started:
+        # Let the flush task enter its window before cancelling it
+        await asyncio.sleep(0)
+    cache_manager._search_gets._task.cancel()
+
+    assert await asyncio.wait_for(lookup, timeout=1) is None
+    assert cache_manager._search_gets._task is None
+    assert await cache_manager.get_search_cache("query", limit=5) is None
+    cache_manager.redis_client.mget.assert_awaited_once()
@@ -3,6 +3,8 @@
 Tests for config module
 """
 
+from collections.abc import Mapping
+
 import pytest
 from searcrawl.config import get_config_info
 
@@ -11,7 +13,7 @@ def test_get_config_info():
     """Test that get_config_info returns expected structure"""
     config = get_config_info()
     
-    assert isinstance(config, dict)
+    assert isinstance(config, Mapping)
     assert "searxng" in config
     assert "api" in config
     assert "crawler" in config
@@ -45,4 +47,15 @@ def test_config_types():
     assert isinstance(config["searxng"]["port"], int)
     assert isinstance(config["api"]["port"], int)
     assert isinstance(config["crawler"]["default_search_limit"], int)
-    assert isinstance(config["crawler"]["content_filter_threshold"], float)
\ No newline at end of file
+    assert isinstance(config["crawler"]["content_filter_threshold"], float)
+
+
+def test_config_info_is_read_only():
+    """Test that get_config_info returns a shared read-only snapshot"""
+    config = get_config_info()
+
+    assert config is get_config_info()
+    with pytest.raises(TypeError):
+        config["api"] = {}  # type: ignore[index]
+    with pytest.raises(TypeError):
+        config["api"]["port"] = 0  # type: ignore[index]
@@ -3,8 +3,17 @@
 Tests for crawler module
 """
 
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import httpx
 import pytest
-from searcrawl.crawler import WebCrawler
+
+import searcrawl.crawler as crawler_module
+from searcrawl.anti_crawl import AntiCrawlConfig
+from searcrawl.crawler import DomainSlots, WebCrawler, dedupe_urls, is_crawlable_url
 
 
 def test_markdown_to_text_regex():
@@ -62,4 +71,192 @@ def test_webcrawler_creation():
     assert isinstance(crawler, WebCrawler)
     assert hasattr(crawler, 'initialize')
     assert hasattr(crawler, 'close')
-    assert hasattr(crawler, 'crawl_urls')
\ No newline at end of file
+    assert hasattr(crawler, 'crawl_urls')
+
+
+def test_dedupe_urls_preserves_first_original():
+    """Test that equivalent URLs are collapsed to their first spelling"""
+    urls = [
+        "https://Example.com/page?b=2&a=1#top",
+        "https://example.com/page?a=1&b=2",
+        "https://example.com/other",
+        "HTTPS://EXAMPLE.COM/page?b=2&a=1",
+    ]
+
+    assert dedupe_urls(urls) == [
+        "https://Example.com/page?b=2&a=1#top",
+        "https://example.com/other",
+    ]
+
+
+def _fake_crawler(monkeypatch, pages):
+    """Build a WebCrawler whose crawl4ai backend returns canned pages"""
+    monkeypatch.setattr(crawler_module, "READER_ENABLED", False)
+
+    async def arun_stream(urls, run_config):
+        for url in urls:
+            html = pages.get(url)
+            yield SimpleNamespace(
+                url=url,
+                success=html is not None,
+                markdown=SimpleNamespace(fit_html=html, fit_markdown=None),
+            )
+
+    crawler = WebCrawler(anti_crawl_config=AntiCrawlConfig(enable_request_delay=False))
+    crawler.crawler = MagicMock()
+    monkeypatch.setattr(crawler, "_arun_stream", arun_stream)
+    return crawler
+
+
+async def test_crawl_urls_stream_yields_results_as_ready(monkeypatch):
+    """Test that the stream yields plain text results one at a time"""
+    crawler = _fake_crawler(monkeypatch, {"https://a.com": "<p>A</p>", "https://b.com": "<p>B</p>"})
+
+    stream = crawler.crawl_urls_stream(["https://a.com", "https://b.com"], "query")
+    first = await stream.__anext__()
+    assert first == {"content": "A", "reference": "https://a.com", "cached": False}
+
+    rest = [result async for result in stream]
+    assert [result["reference"] for result in rest] == ["https://b.com"]
+
+
+async def test_crawl_urls_buffers_stream_and_reports_failures(monkeypatch):
+    """Test that the buffered wrapper keeps the original response shape"""
+    crawler = _fake_crawler(monkeypatch, {"https://a.com": "<p>A</p>"})
+
+    response = await crawler.crawl_urls(["https://a.com", "https://b.com"], "query")
+
+    assert response["results"] == [{"content": "A", "reference": "https://a.com"}]
+    assert response["success_count"] == 1
+    assert response["failed_urls"] == ["https://b.com"]
+    assert response["cache_hits"] == 0
+    assert response["newly_crawled"] == 1
+
+
+async def test_crawl_urls_does_not_wait_for_retry_batch_when_done(monkeypatch):
+    """Test that a finished crawl skips the retry batching interval"""
+    crawler = _fake_crawler(monkeypatch, {"https://a.com": "<p>A</p>", "https://b.com": "<p>B</p>"})
+    assert crawler_module.RETRY_BATCH_INTERVAL > 0.1
+
+    started = time.monotonic()
+    response = await crawler.crawl_urls(["https://a.com", "https://b.com"], "query")
+
+    assert response["success_count"] == 2
+    assert time.monotonic() - started < crawler_module.RETRY_BATCH_INTERVAL / 2
+
+
+def test_process_result_handles_incomplete_results():
+    """Test that results missing attributes are treated as failures"""
+    url = "https://a.com"
+    assert WebCrawler._process_result(None, url) is None
+    assert WebCrawler._process_result(SimpleNamespace(), url) is None
+    assert WebCrawler._process_result(SimpleNamespace(success=True, markdown=None), url) is None
+
+    markdown = SimpleNamespace(fit_html=None, fit_markdown="# A")
+    assert WebCrawler._process_result(SimpleNamespace(success=True, markdown=markdown), url) == {
+        "content": "# A", "reference": url
+    }
+
+
+def test_is_crawlable_url_filters_schemes_and_ip_hosts():
+    """Test that only http(s) URLs with host names are crawled"""
+    assert is_crawlable_url("https://example.com/page")
+    assert is_crawlable_url("HTTP://Example.com:8080/")
+    assert not is_crawlable_url("ftp://example.com/file")
+    assert not is_crawlable_url("javascript:alert(1)")
+    assert not is_crawlable_url("http://127.0.0.1/admin")
+    assert not is_crawlable_url("http://[::1]:8080/")
+    assert not is_crawlable_url("https:///no-host")
+
+
+async def test_domain_slots_limit_concurrency_per_domain():
+    """Test that pages of one domain wait for a slot while other domains proceed"""
+    slots = DomainSlots(limit=1)
+    release = asyncio.Event()
+    entered = []
+
+    async def fetch(url):
+        async with slots.acquire(url):
+            entered.append(url)
+            await release.wait()
+
+    tasks = [asyncio.create_task(fetch(url)) for url in
+             ("https://a.com/1", "https://A.com/2", "https://b.com/1")]
+    await asyncio.sleep(0)
+    assert entered == ["https://a.com/1", "https://b.com/1"]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert entered[-1] == "https://A.com/2"
+
+
+async def test_domain_slots_evict_idle_domains_only():
+    """Test that the domain map stays bounded without dropping held slots"""
+    slots = DomainSlots(limit=1, max_domains=2)
+
+    async with slots.acquire("https://held.com/"):
+        for index in range(5):
+            async with slots.acquire(f"https://site{index}.com/"):
+                pass
+        assert len(slots) == 2
+        assert "held.com" in slots._domains
+
+
+@pytest.fixture
+async def searxng(monkeypatch):
+    """Route SearXNG requests to a handler set by the test, without retry delays"""
+    handlers = []
+    transport = httpx.MockTransport(lambda request: handlers[0](request))
+    client = httpx.AsyncClient(base_url="http://searxng", transport=transport)
+    monkeypatch.setattr(crawler_module, "_searxng_client", client)
+    monkeypatch.setattr(crawler_module, "_searxng_retry_delay", lambda attempt, response: 0.0)
+    yield handlers.append
+    await client.aclose()
+
+
+def test_searxng_retry_delay_honors_retry_after():
+    """Test that Retry-After seconds win over backoff, and both are capped"""
+    assert crawler_module._searxng_retry_delay(0, httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+    assert crawler_module._searxng_retry_delay(0, httpx.Response(429, headers={"Retry-After": "900"})) == \
+        crawler_module.SEARXNG_RETRY_MAX_DELAY
+    assert 4.0 <= crawler_module._searxng_retry_delay(2, httpx.Response(503)) < 5.0
+    assert crawler_module._searxng_retry_delay(10, httpx.Response(503)) == crawler_module.SEARXNG_RETRY_MAX_DELAY
+
+
+async def test_searxng_request_retries_throttled_responses(searxng, monkeypatch):
+    """Test that 429/503 responses are retried until SearXNG answers"""
+    statuses = iter([429, 503, 200])
+    delays = []
+
+    def handler(request):
+        status = next(statuses)
+        if status == 200:
+            return httpx.Response(200, json={"results": [{"url": "https://a.com"}]})
+        return httpx.Response(status)
+
+    def no_delay(attempt, response):
+        delays.append((attempt, response.status_code))
+        return 0.0
+
+    searxng(handler)
+    monkeypatch.setattr(crawler_module, "_searxng_retry_delay", no_delay)
+
+    response = await WebCrawler.make_searxng_request("query")
+
+    assert response == {"results": [{"url": "https://a.com"}]}
+    assert delays == [(0, 429), (1, 503)]
+
+
+async def test_searxng_request_gives_up_after_attempts(searxng):
+    """Test that persistent throttling surfaces as a search failure"""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, text="busy")
+
+    searxng(handler)
+
+    with pytest.raises(Exception, match="Search request failed"):
+        await WebCrawler.make_searxng_request("query")
+    assert len(calls) == crawler_module.SEARXNG_RETRY_ATTEMPTS
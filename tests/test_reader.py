@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for reader module
+"""
+
+from searcrawl import reader
+
+
+async def test_reader_session_is_shared_until_closed():
+    """Test that fetches reuse one session and closing resets it"""
+    session = reader.get_session()
+    assert reader.get_session() is session
+
+    await reader.close_session()
+    assert session.closed
+    assert reader._session is None